@@ -0,0 +1 @@
+"""Shared tooling for running the Advent of Code 2023 solutions"""
@@ -0,0 +1,257 @@
+"""Command line entry point: `python -m aoc2023 <command>`"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from aoc2023 import bench, cache, generators, profiling, report, runner
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aoc2023")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_cmd = commands.add_parser("run", help="Run solutions in one process")
+    add_common_args(run_cmd)
+    run_cmd.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes (0: one per core, default: 1)",
+    )
+    run_cmd.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse parsed inputs and answers while input and solver are unchanged",
+    )
+    run_cmd.add_argument("--cache-dir", type=Path, default=cache.DEFAULT_DIR)
+    run_cmd.add_argument(
+        "--cache-size",
+        type=int,
+        default=cache.DEFAULT_MAX_BYTES // 2 ** 20,
+        help="Cache size limit in MB (least recently used entries are evicted)",
+    )
+
+    run_cmd.add_argument(
+        "--profile",
+        nargs="?",
+        const="profiles",
+        metavar="DIR",
+        help="Write .pstats and collapsed stacks of each stage (default: profiles/)",
+    )
+    run_cmd.add_argument(
+        "--memory",
+        action="store_true",
+        help="Report peak allocation and the top allocating lines of each stage",
+    )
+    run_cmd.add_argument("--memory-top", type=int, default=10)
+
+    run_cmd.add_argument(
+        "--report",
+        metavar="PATH",
+        help="Write each part's answer, timings, peak memory (with --memory) "
+        'and input hash to PATH ("-": stdout instead of the table)',
+    )
+    run_cmd.add_argument(
+        "--report-format",
+        choices=report.FORMATS,
+        default="jsonl",
+    )
+
+    clear_cmd = commands.add_parser("clear-cache", help="Remove cached entries")
+    clear_cmd.add_argument("--cache-dir", type=Path, default=cache.DEFAULT_DIR)
+
+    bench_cmd = commands.add_parser("bench", help="Benchmark each stage")
+    add_common_args(bench_cmd)
+    bench_cmd.add_argument("--warmup", type=int, default=1)
+    bench_cmd.add_argument("--repeats", type=int, default=5)
+    bench_cmd.add_argument(
+        "--output",
+        default="bench_results.json",
+        help="Where to write the JSON results",
+    )
+    bench_cmd.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        help="JSON results to compare against (flags regressions)",
+    )
+    bench_cmd.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown of the median counted as a regression",
+    )
+
+    generate_cmd = commands.add_parser(
+        "generate",
+        help="Write synthetic inputs to each day's data/ directory",
+    )
+    generate_cmd.add_argument(
+        "--days",
+        type=runner.parse_days,
+        default=runner.ALL_DAYS,
+        help='Days to generate inputs for (default: all)',
+    )
+    generate_cmd.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Input size relative to the puzzle input",
+    )
+    generate_cmd.add_argument("--seed", type=int, default=0)
+
+    scaling_cmd = commands.add_parser(
+        "scaling",
+        help="Benchmark each stage on generated inputs of increasing size",
+    )
+    scaling_cmd.add_argument(
+        "--days",
+        type=runner.parse_days,
+        default=runner.ALL_DAYS,
+        help='Days to benchmark (default: all)',
+    )
+    scaling_cmd.add_argument(
+        "--scales",
+        type=lambda s: [float(v) for v in s.split(",")],
+        default=[1.0, 10.0, 100.0],
+        help='Comma separated input scales (default: "1,10,100")',
+    )
+    scaling_cmd.add_argument("--seed", type=int, default=0)
+    scaling_cmd.add_argument("--warmup", type=int, default=0)
+    scaling_cmd.add_argument("--repeats", type=int, default=3)
+    scaling_cmd.add_argument(
+        "--output",
+        default="scaling_results.json",
+        help="Where to write the JSON results",
+    )
+
+    return parser
+
+
+def add_common_args(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--days",
+        type=runner.parse_days,
+        default=runner.ALL_DAYS,
+        help='Days to run, e.g. "1-25" or "1,3,5-7" (default: all)',
+    )
+    parser.add_argument(
+        "--input",
+        default="input.txt",
+        help="Input file name inside each day's data/ directory",
+    )
+
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+
+    if args.command == "run":
+        # The first hook is the outermost, so the profiler (innermost) doesn't
+        # profile the memory tracer's snapshots
+        hooks = []
+        if args.memory:
+            hooks.append(profiling.MemoryTracer(top=args.memory_top))
+        if args.profile:
+            hooks.append(profiling.Profiler(args.profile))
+
+        if hooks and args.jobs != 1:
+            parser.error("--profile and --memory need --jobs 1")
+
+        run_cache = None
+        if args.cache:
+            run_cache = cache.Cache(args.cache_dir, max_bytes=args.cache_size * 2 ** 20)
+
+        start = time.perf_counter()
+
+        if args.jobs == 1:
+            results = runner.run(
+                args.days,
+                input_name=args.input,
+                cache=run_cache,
+                hooks=tuple(hooks),
+            )
+        else:
+            results = runner.run_parallel(
+                args.days,
+                input_name=args.input,
+                max_workers=args.jobs or None,
+                cache=run_cache,
+            )
+
+        wall_time = time.perf_counter() - start
+
+        if args.report:
+            memory_stats = [
+                s
+                for hook in hooks
+                if isinstance(hook, profiling.MemoryTracer)
+                for s in hook.stats
+            ]
+            reports = report.build_reports(
+                results,
+                input_name=args.input,
+                memory_stats=memory_stats,
+            )
+
+            if args.report == "-":
+                report.write_report(reports, sys.stdout, fmt=args.report_format)
+                return
+
+            with open(args.report, "w", newline="") as fout:
+                report.write_report(reports, fout, fmt=args.report_format)
+
+        print(runner.format_results(results))
+        print(f"Wall time: {wall_time * 1e3:.3f} ms")
+
+        for hook in hooks:
+            print()
+            print(hook.format_summary())
+
+    elif args.command == "bench":
+        stats = bench.bench(
+            args.days,
+            input_name=args.input,
+            warmup=args.warmup,
+            repeats=args.repeats,
+        )
+        print(bench.format_stats(stats))
+        bench.save_results(
+            args.output,
+            stats,
+            input=args.input,
+            warmup=args.warmup,
+            repeats=args.repeats,
+        )
+
+        if args.compare:
+            baseline = bench.load_results(args.compare)
+            comparisons = bench.compare(stats, baseline, threshold=args.threshold)
+            print()
+            print(bench.format_comparisons(comparisons))
+
+            if any(c.is_regression for c in comparisons):
+                sys.exit(1)
+
+    elif args.command == "clear-cache":
+        cache.Cache(args.cache_dir).clear()
+
+    elif args.command == "generate":
+        for day in args.days:
+            path = generators.write_input(day, scale=args.scale, seed=args.seed)
+            print(path)
+
+    elif args.command == "scaling":
+        points = bench.bench_scaling(
+            args.days,
+            scales=args.scales,
+            seed=args.seed,
+            warmup=args.warmup,
+            repeats=args.repeats,
+        )
+        print(bench.format_scaling(points))
+        bench.save_scaling(args.output, points, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""Benchmarks the parsing and solving stages of each day"""
+import copy
+import json
+import math
+import statistics
+import sys
+import time
+from typing import Any, Callable, NamedTuple
+
+from aoc2023 import generators
+from aoc2023.runner import MUTATING_DAYS, SOLVER_KWARGS, Day, load_day, load_days
+
+
+class StageStats(NamedTuple):
+    day: int
+    stage: str
+    repeats: int
+    median: float
+    p95: float
+    stddev: float
+    min: float
+    max: float
+
+    @classmethod
+    def from_timings(cls, day: int, stage: str, timings: list[float]) -> "StageStats":
+        return cls(
+            day=day,
+            stage=stage,
+            repeats=len(timings),
+            median=statistics.median(timings),
+            p95=percentile(timings, 95),
+            stddev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            min=min(timings),
+            max=max(timings),
+        )
+
+
+class ScalePoint(NamedTuple):
+    scale: float
+    stats: StageStats
+
+
+class Comparison(NamedTuple):
+    day: int
+    stage: str
+    baseline: float
+    current: float
+    is_regression: bool
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline > 0 else math.inf
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def reset_caches(day: Day):
+    """Clears `functools.cache`-d functions, so repeats don't reuse answers."""
+    for obj in vars(day.module).values():
+        if callable(getattr(obj, "cache_clear", None)):
+            obj.cache_clear()
+
+
+def time_calls(
+    fn: Callable[[], Any],
+    setup: Callable[[], None],
+    warmup: int,
+    repeats: int,
+) -> list[float]:
+    timings = []
+
+    for i in range(warmup + repeats):
+        setup()
+
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+
+        if i >= warmup:
+            timings.append(elapsed)
+
+    return timings
+
+
+def bench_day(
+    day: Day,
+    input_name: str = "input.txt",
+    warmup: int = 1,
+    repeats: int = 5,
+) -> list[StageStats]:
+    path = str(day.data_dir / input_name)
+    module = day.module
+
+    timings = time_calls(
+        fn=lambda: module.parse_input(path),
+        setup=lambda: reset_caches(day),
+        warmup=warmup,
+        repeats=repeats,
+    )
+    stats = [StageStats.from_timings(day.number, "parse_input", timings)]
+
+    parsed = module.parse_input(path)
+
+    for stage in day.solvers():
+        solver = getattr(module, stage)
+        kwargs = SOLVER_KWARGS.get((day.number, stage), {})
+        data = parsed
+
+        def _setup():
+            nonlocal data
+            reset_caches(day)
+            if day.number in MUTATING_DAYS:
+                data = copy.deepcopy(parsed)
+
+        timings = time_calls(
+            fn=lambda: solver(data, **kwargs),
+            setup=_setup,
+            warmup=warmup,
+            repeats=repeats,
+        )
+        stats.append(StageStats.from_timings(day.number, stage, timings))
+
+    return stats
+
+
+def bench(
+    days: list[int],
+    input_name: str = "input.txt",
+    warmup: int = 1,
+    repeats: int = 5,
+) -> list[StageStats]:
+    stats = []
+
+    for day in load_days(days, input_name=input_name):
+        stats.extend(bench_day(day, input_name, warmup=warmup, repeats=repeats))
+
+    return stats
+
+
+def bench_scaling(
+    days: list[int],
+    scales: list[float],
+    seed: int = 0,
+    warmup: int = 0,
+    repeats: int = 3,
+) -> list[ScalePoint]:
+    """Benchmarks each day on generated inputs of increasing size."""
+    points = []
+
+    for number in days:
+        try:
+            day = load_day(number)
+        except ImportError as e:
+            print(f"day{number:02d}: {e}, skipping", file=sys.stderr)
+            continue
+
+        for scale in scales:
+            path = generators.write_input(number, scale=scale, seed=seed)
+            for stats in bench_day(day, path.name, warmup=warmup, repeats=repeats):
+                points.append(ScalePoint(scale=scale, stats=stats))
+
+    return points
+
+
+def growth_exponent(points: list[ScalePoint]) -> float:
+    """Slope of log(time) vs. log(scale) between the smallest and the largest
+    input, i.e. ~1 for linear and ~2 for quadratic stages."""
+    first = min(points, key=lambda p: p.scale)
+    last = max(points, key=lambda p: p.scale)
+
+    if first.scale == last.scale or first.stats.median <= 0:
+        return math.nan
+
+    return (
+        math.log(last.stats.median / first.stats.median)
+        / math.log(last.scale / first.scale)
+    )
+
+
+def save_results(path: str, stats: list[StageStats], **metadata):
+    with open(path, "w") as fout:
+        json.dump(
+            {**metadata, "results": [s._asdict() for s in stats]},
+            fout,
+            indent=2,
+        )
+
+
+def save_scaling(path: str, points: list[ScalePoint], **metadata):
+    with open(path, "w") as fout:
+        json.dump(
+            {
+                **metadata,
+                "results": [
+                    {"scale": p.scale, **p.stats._asdict()} for p in points
+                ],
+            },
+            fout,
+            indent=2,
+        )
+
+
+def load_results(path: str) -> list[StageStats]:
+    with open(path, "r") as fin:
+        return [StageStats(**r) for r in json.load(fin)["results"]]
+
+
+def compare(
+    stats: list[StageStats],
+    baseline: list[StageStats],
+    threshold: float = 0.1,
+) -> list[Comparison]:
+    """Compares medians; a stage regressed if it is `threshold` slower."""
+    baseline_medians = {(s.day, s.stage): s.median for s in baseline}
+
+    comparisons = []
+    for s in stats:
+        if (s.day, s.stage) not in baseline_medians:
+            continue
+
+        base = baseline_medians[(s.day, s.stage)]
+        comparisons.append(
+            Comparison(
+                day=s.day,
+                stage=s.stage,
+                baseline=base,
+                current=s.median,
+                is_regression=s.median > base * (1 + threshold),
+            )
+        )
+
+    return comparisons
+
+
+def format_stats(stats: list[StageStats]) -> str:
+    lines = [
+        f"{'Day':<6} {'Stage':<15} {'Median [ms]':>12} {'p95 [ms]':>12} "
+        f"{'Stddev [ms]':>12}"
+    ]
+
+    for s in stats:
+        lines.append(
+            f"day{s.day:02d}  {s.stage:<15} {s.median * 1e3:>12.3f} "
+            f"{s.p95 * 1e3:>12.3f} {s.stddev * 1e3:>12.3f}"
+        )
+
+    return "\n".join(lines)
+
+
+def format_scaling(points: list[ScalePoint]) -> str:
+    scales = sorted({p.scale for p in points})
+    by_stage: dict[tuple[int, str], list[ScalePoint]] = {}
+    for p in points:
+        by_stage.setdefault((p.stats.day, p.stats.stage), []).append(p)
+
+    lines = [
+        f"{'Day':<6} {'Stage':<15} "
+        + " ".join(f"{f'x{s:g} [ms]':>12}" for s in scales)
+        + f" {'Exponent':>9}"
+    ]
+
+    for (day, stage), stage_points in by_stage.items():
+        medians = {p.scale: p.stats.median for p in stage_points}
+        lines.append(
+            f"day{day:02d}  {stage:<15} "
+            + " ".join(f"{medians[s] * 1e3:>12.3f}" for s in scales)
+            + f" {growth_exponent(stage_points):>9.2f}"
+        )
+
+    return "\n".join(lines)
+
+
+def format_comparisons(comparisons: list[Comparison]) -> str:
+    lines = [
+        f"{'Day':<6} {'Stage':<15} {'Baseline [ms]':>14} {'Current [ms]':>14} "
+        f"{'Ratio':>7}"
+    ]
+
+    for c in comparisons:
+        flag = "  REGRESSION" if c.is_regression else ""
+        lines.append(
+            f"day{c.day:02d}  {c.stage:<15} {c.baseline * 1e3:>14.3f} "
+            f"{c.current * 1e3:>14.3f} {c.ratio:>7.2f}{flag}"
+        )
+
+    return "\n".join(lines)
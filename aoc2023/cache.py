@@ -0,0 +1,152 @@
+"""Content-addressed on-disk cache of parsed inputs and answers"""
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+DEFAULT_DIR = Path(__file__).resolve().parent.parent / ".cache"
+DEFAULT_MAX_BYTES = 512 * 2 ** 20
+
+
+def update_digest(digest, path: str, chunk_size: int = 2 ** 20):
+    """Feeds the bytes of a file to a hashlib digest, in chunks."""
+    with open(path, "rb") as fin:
+        while chunk := fin.read(chunk_size):
+            digest.update(chunk)
+
+
+class Cache:
+    """Pickles values into one file per key and evicts the least recently
+    used files once their total size exceeds `max_bytes`."""
+
+    def __init__(
+        self,
+        directory: Path = DEFAULT_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def day_key(input_path: str, *source_paths: str) -> str:
+        """Hash of the input file and the solver's source code."""
+        digest = hashlib.sha256()
+
+        for path in (input_path, *source_paths):
+            update_digest(digest, path)
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def parsed_key(day_key: str) -> str:
+        return f"{day_key}-parsed"
+
+    @staticmethod
+    def answer_key(day_key: str, stage: str, kwargs: dict[str, Any]) -> str:
+        kwargs_digest = hashlib.sha256(repr(sorted(kwargs.items())).encode())
+        return f"{day_key}-{stage}-{kwargs_digest.hexdigest()[:16]}"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def get(self, key: str) -> Any:
+        path = self._path(key)
+
+        try:
+            with open(path, "rb") as fin:
+                value = pickle.load(fin)
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+        os.utime(path)  # Mark as recently used
+        return value
+
+    def put(self, key: str, value: Any):
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first, so readers never see partial files
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fout:
+            pickle.dump(value, fout, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._path(key))
+
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for path in self.directory.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # Evicted by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def clear(self):
+        for path in self.directory.glob("*.pickle"):
+            path.unlink(missing_ok=True)
+
+
+def run_tests():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        cache = Cache(tmp_dir / "cache", max_bytes=2500)
+
+        # Keys change with the input and with any of the source files
+        input_path = tmp_dir / "input.txt"
+        source_paths = [tmp_dir / "main.py", tmp_dir / "shared.py"]
+        input_path.write_text("1\n")
+        for path in source_paths:
+            path.write_text("x = 1\n")
+        key = Cache.day_key(input_path, *source_paths)
+        assert Cache.day_key(input_path, *source_paths) == key
+
+        input_path.write_text("2\n")
+        assert Cache.day_key(input_path, *source_paths) != key
+        input_path.write_text("1\n")
+        source_paths[1].write_text("x = 2\n")
+        assert Cache.day_key(input_path, *source_paths) != key
+
+        assert Cache.answer_key(key, "solve_part_one", {"a": 1, "b": 2}) == (
+            Cache.answer_key(key, "solve_part_one", {"b": 2, "a": 1})
+        )
+
+        # Hits and misses
+        cache.put("a", bytes(1000))
+        assert cache.get("a") == bytes(1000)
+        try:
+            cache.get("missing")
+        except KeyError:
+            pass
+        else:
+            raise AssertionError("Missing keys should raise KeyError")
+
+        # Eviction of the least recently used entries (2 of 1000 bytes fit)
+        cache.put("b", bytes(1000))
+        os.utime(cache._path("a"), (1, 1))
+        os.utime(cache._path("b"), (2, 2))
+        cache.get("a")
+        cache.put("c", bytes(1000))
+
+        assert sorted(path.stem for path in cache.directory.iterdir()) == [
+            "a", "c",
+        ]
+
+        cache.clear()
+        assert not list(cache.directory.iterdir())
+
+
+if __name__ == "__main__":
+    run_tests()
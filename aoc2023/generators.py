@@ -0,0 +1,822 @@
+"""Seeded generators of synthetic (scaled) puzzle inputs"""
+import itertools
+import math
+import random
+import string
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+from aoc2023.runner import ROOT_DIR
+
+
+class Generator(NamedTuple):
+    fn: Callable[..., str]
+    sizes: dict[str, int]  # Puzzle-sized defaults, multiplied by the scale
+
+
+# Sizes along one grid dimension grow with sqrt(scale), so that the number
+# of cells (i.e. the input size) grows with the scale
+LINEAR_SIZES = {"width", "height", "size", "corridor_length"}
+
+
+def unique_names(
+    rng: random.Random,
+    n: int,
+    alphabet: str = string.ascii_lowercase,
+    min_length: int = 2,
+    exclude: tuple[str, ...] = (),
+) -> list[str]:
+    length = max(min_length, math.ceil(math.log(4 * n, len(alphabet))))
+
+    names = []
+    seen = set(exclude)
+    while len(names) < n:
+        name = "".join(rng.choices(alphabet, k=length))
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+
+    return names
+
+
+def generate_day01(rng: random.Random, n_lines: int, max_length: int = 50) -> str:
+    words = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+    lines = []
+
+    for _ in range(n_lines):
+        length = rng.randint(5, max_length)
+        chunks = [rng.choice("123456789")]
+
+        while sum(len(c) for c in chunks) < length:
+            r = rng.random()
+            if r < 0.1:
+                chunks.append(rng.choice("123456789"))
+            elif r < 0.25:
+                chunks.append(rng.choice(words))
+            else:
+                chunks.append(rng.choice(string.ascii_lowercase))
+
+        rng.shuffle(chunks)
+        lines.append("".join(chunks))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day02(
+    rng: random.Random,
+    n_games: int,
+    max_samples: int = 6,
+    max_cubes: int = 20,
+) -> str:
+    lines = []
+
+    for game_id in range(1, n_games + 1):
+        samples = []
+        for _ in range(rng.randint(1, max_samples)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            samples.append(
+                ", ".join(f"{rng.randint(1, max_cubes)} {c}" for c in colors)
+            )
+
+        lines.append(f"Game {game_id}: " + "; ".join(samples))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day03(rng: random.Random, width: int, height: int) -> str:
+    rows = []
+
+    for _ in range(height):
+        row = ""
+        last_was_number = False
+
+        while len(row) < width:
+            row += "." * rng.randint(1 if last_was_number else 0, 4)
+
+            if rng.random() < 0.7:
+                row += str(rng.randint(1, 999))
+                last_was_number = True
+            else:
+                row += rng.choice("*#+$/@=%&-")
+                last_was_number = False
+
+        rows.append(row[:width])
+
+    return "\n".join(rows) + "\n"
+
+
+def generate_day04(
+    rng: random.Random,
+    n_cards: int,
+    n_winning: int = 10,
+    n_numbers: int = 25,
+) -> str:
+    # Less than one match per card on average keeps the number of copies
+    # linear in the number of cards (instead of exponential)
+    weights = [3.0 ** -k for k in range(n_winning + 1)]
+    lines = []
+
+    for card_id in range(1, n_cards + 1):
+        n_matching = rng.choices(range(n_winning + 1), weights=weights)[0]
+        n_matching = min(n_matching, n_cards - card_id)
+
+        winning = rng.sample(range(1, 100), n_winning)
+        others = [n for n in range(1, 100) if n not in winning]
+        numbers = [
+            *rng.sample(winning, n_matching),
+            *rng.sample(others, n_numbers - n_matching),
+        ]
+        rng.shuffle(numbers)
+
+        lines.append(
+            f"Card {card_id:>3}: "
+            + " ".join(f"{n:>2}" for n in winning)
+            + " | "
+            + " ".join(f"{n:>2}" for n in numbers)
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day05(rng: random.Random, n_seed_pairs: int, n_ranges: int) -> str:
+    categories = [
+        "seed", "soil", "fertilizer", "water",
+        "light", "temperature", "humidity", "location",
+    ]
+    max_value = 2 ** 32
+
+    seeds = []
+    for _ in range(n_seed_pairs):
+        seeds.append(rng.randrange(max_value // 2))
+        seeds.append(rng.randint(1, max_value // (4 * n_seed_pairs)))
+
+    blocks = []
+    for src, dst in zip(categories, categories[1:]):
+        bounds = sorted(rng.sample(range(max_value), 2 * n_ranges))
+
+        mappings = []
+        for begin, end in zip(bounds[::2], bounds[1::2]):
+            length = end - begin
+            dst_begin = rng.randrange(max_value - length)
+            mappings.append(f"{dst_begin} {begin} {length}")
+
+        rng.shuffle(mappings)
+        blocks.append(f"{src}-to-{dst} map:\n" + "\n".join(mappings))
+
+    return (
+        "seeds: " + " ".join(str(s) for s in seeds) + "\n\n"
+        + "\n\n".join(blocks) + "\n"
+    )
+
+
+def generate_day06(rng: random.Random, n_races: int, max_duration: int = 99) -> str:
+    """Note: part two concatenates all races, so its duration has
+    ~2 * `n_races` digits."""
+    times, distances = [], []
+
+    for _ in range(n_races):
+        duration = rng.randint(7, max_duration)
+        max_distance = (duration // 2) * (duration - duration // 2)
+
+        times.append(duration)
+        distances.append(rng.randint(duration, max_distance - 1))
+
+    return (
+        "Time:     " + " ".join(f"{t:>4}" for t in times) + "\n"
+        + "Distance: " + " ".join(f"{d:>4}" for d in distances) + "\n"
+    )
+
+
+def generate_day07(rng: random.Random, n_hands: int) -> str:
+    lines = [
+        f"{''.join(rng.choices('23456789TJQKA', k=5))} {rng.randint(1, 1000)}"
+        for _ in range(n_hands)
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def generate_day08(
+    rng: random.Random,
+    n_nodes: int,
+    n_ghosts: int = 6,
+    instruction_length: int = 263,
+) -> str:
+    """Each ghost walks a ring of node pairs (both nodes of a pair lead to
+    the next pair), so it hits its Z node every `ring_length` steps, as
+    assumed by the LCM-based solution."""
+    names = [
+        "".join(c)
+        for c in itertools.product(string.ascii_uppercase + "123456789", repeat=3)
+    ]
+    inner_names = [n for n in names if n[-1] not in "AZ"]
+    start_names = [n for n in names if n[-1] == "A" and n != "AAA"]
+    end_names = [n for n in names if n[-1] == "Z" and n != "ZZZ"]
+
+    max_ring_length = max(3, n_nodes // (2 * n_ghosts))
+
+    if 2 * max_ring_length * n_ghosts > len(inner_names):
+        raise ValueError(
+            f"At most {len(inner_names)} nodes fit into 3-character names"
+        )
+
+    rng.shuffle(inner_names)
+    inner = iter(inner_names)
+    starts = ["AAA", *rng.sample(start_names, n_ghosts - 1)]
+    ends = ["ZZZ", *rng.sample(end_names, n_ghosts - 1)]
+
+    nodes = {}
+
+    for start, end in zip(starts, ends):
+        ring_length = rng.randint(max_ring_length // 2 + 1, max_ring_length)
+        pairs = [(next(inner), next(inner)) for _ in range(ring_length - 1)]
+
+        first = list(pairs[0])
+        rng.shuffle(first)
+        nodes[start] = tuple(first)
+        nodes[end] = tuple(first)
+
+        for pair, next_pair in zip(pairs, [*pairs[1:], (end, end)]):
+            children = list(next_pair)
+            rng.shuffle(children)
+            for name in pair:
+                nodes[name] = tuple(children)
+
+    lines = [f"{name} = ({left}, {right})" for name, (left, right) in nodes.items()]
+    rng.shuffle(lines)
+
+    instructions = "".join(rng.choices("LR", k=instruction_length))
+
+    return instructions + "\n\n" + "\n".join(lines) + "\n"
+
+
+def generate_day09(
+    rng: random.Random,
+    n_histories: int,
+    history_length: int = 21,
+    max_degree: int = 8,
+) -> str:
+    lines = []
+
+    for _ in range(n_histories):
+        degree = rng.randint(1, min(max_degree, history_length - 2))
+        coefficients = [rng.randint(-9, 9) for _ in range(degree + 1)]
+        values = [
+            sum(c * math.comb(i, k) for k, c in enumerate(coefficients))
+            for i in range(history_length)
+        ]
+        lines.append(" ".join(str(v) for v in values))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day10(rng: random.Random, width: int, height: int) -> str:
+    """The loop is the outline of a random histogram; "S" is placed on its
+    left (vertical) side."""
+    width, height = max(width, 5), max(height, 5)
+    x0, x1, bottom = 1, width - 2, height - 2
+
+    tops = [rng.randint(1, bottom - 1) for _ in range(width)]
+    tops[x0] = rng.randint(1, bottom - 2)
+
+    path = [(x0, y) for y in range(bottom, tops[x0] - 1, -1)]
+    y = tops[x0]
+
+    for x in range(x0 + 1, x1 + 1):
+        path.append((x, y))
+        target = tops[x] if x < x1 else bottom
+        step = 1 if target > y else -1
+        path.extend((x, yy) for yy in range(y + step, target + step, step))
+        y = target
+
+    path.extend((x, bottom) for x in range(x1 - 1, x0, -1))
+
+    grid = [
+        [rng.choice("|-LJ7F....") for _ in range(width)]
+        for _ in range(height)
+    ]
+
+    shapes = {
+        frozenset("NS"): "|", frozenset("EW"): "-", frozenset("NE"): "L",
+        frozenset("NW"): "J", frozenset("SW"): "7", frozenset("SE"): "F",
+    }
+
+    def _direction(src: tuple[int, int], dst: tuple[int, int]) -> str:
+        dx, dy = dst[0] - src[0], dst[1] - src[1]
+        return {(0, -1): "N", (0, 1): "S", (-1, 0): "W", (1, 0): "E"}[(dx, dy)]
+
+    for idx, (x, y) in enumerate(path):
+        prev_pos, next_pos = path[idx - 1], path[(idx + 1) % len(path)]
+        grid[y][x] = shapes[
+            frozenset([_direction((x, y), prev_pos), _direction((x, y), next_pos)])
+        ]
+
+    loop = set(path)
+    start_x, start_y = x0, rng.randint(tops[x0] + 1, bottom - 1)
+    grid[start_y][start_x] = "S"
+
+    # Nothing apart from the loop may connect to "S"
+    for x in (start_x - 1, start_x + 1):
+        if (x, start_y) not in loop:
+            grid[start_y][x] = "."
+
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def generate_day11(
+    rng: random.Random,
+    width: int,
+    height: int,
+    density: float = 0.02,
+) -> str:
+    rows = [
+        "".join("#" if rng.random() < density else "." for _ in range(width))
+        for _ in range(height)
+    ]
+    return "\n".join(rows) + "\n"
+
+
+def generate_day12(
+    rng: random.Random,
+    n_rows: int,
+    row_length: int = 20,
+    unknown_rate: float = 0.5,
+) -> str:
+    lines = []
+
+    for _ in range(n_rows):
+        sizes = []
+        while not sizes:
+            state = "".join(rng.choice(".#") for _ in range(row_length))
+            sizes = [len(block) for block in state.split(".") if block]
+
+        masked = "".join("?" if rng.random() < unknown_rate else c for c in state)
+        lines.append(f"{masked} {','.join(str(s) for s in sizes)}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _reflection_diffs(rows: list[str]) -> list[int]:
+    diffs = []
+
+    for idx in range(len(rows) - 1):
+        n = min(idx + 1, len(rows) - idx - 1)
+        diffs.append(sum(
+            a != b
+            for k in range(n)
+            for a, b in zip(rows[idx - k], rows[idx + 1 + k])
+        ))
+
+    return diffs
+
+
+def _generate_day13_pattern(
+    rng: random.Random,
+    width: int,
+    height: int,
+) -> list[str] | None:
+    # Perfect horizontal reflection (part one) after row `h_idx`
+    h_idx = rng.randrange(height - 1)
+    n = min(h_idx + 1, height - h_idx - 1)
+    if 2 * n == height:
+        return None
+
+    rows = [[rng.choice("#.") for _ in range(width)] for _ in range(height)]
+    for k in range(n):
+        rows[h_idx + 1 + k] = list(rows[h_idx - k])
+
+    # Vertical reflection after column `v_idx` ...
+    v_idx = rng.randrange(width - 1)
+    m = min(v_idx + 1, width - v_idx - 1)
+    for row in rows:
+        for k in range(m):
+            row[v_idx + 1 + k] = row[v_idx - k]
+
+    # ... with a smudge (part two) in a row not covered by the reflection
+    unpaired = [i for i in range(height) if not h_idx - n < i <= h_idx + n]
+    i = rng.choice(unpaired)
+    j = rng.randint(v_idx - m + 1, v_idx)
+    rows[i][j] = "#" if rows[i][j] == "." else "."
+
+    pattern = ["".join(row) for row in rows]
+    if rng.random() < 0.5:
+        pattern = ["".join(col) for col in zip(*pattern)]
+
+    diffs = [
+        *_reflection_diffs(pattern),
+        *_reflection_diffs(["".join(col) for col in zip(*pattern)]),
+    ]
+    if diffs.count(0) != 1 or diffs.count(1) != 1:
+        return None
+
+    return pattern
+
+
+def generate_day13(
+    rng: random.Random,
+    n_patterns: int,
+    min_size: int = 5,
+    max_size: int = 17,
+) -> str:
+    patterns = []
+
+    while len(patterns) < n_patterns:
+        pattern = _generate_day13_pattern(
+            rng,
+            width=rng.randint(min_size, max_size),
+            height=rng.randint(min_size, max_size),
+        )
+        if pattern is not None:
+            patterns.append(pattern)
+
+    return "\n\n".join("\n".join(p) for p in patterns) + "\n"
+
+
+def generate_day14(
+    rng: random.Random,
+    width: int,
+    height: int,
+    rounded_rate: float = 0.2,
+    cube_rate: float = 0.1,
+) -> str:
+    def _tile() -> str:
+        r = rng.random()
+        if r < rounded_rate:
+            return "O"
+        elif r < rounded_rate + cube_rate:
+            return "#"
+        return "."
+
+    rows = ["".join(_tile() for _ in range(width)) for _ in range(height)]
+    return "\n".join(rows) + "\n"
+
+
+def generate_day15(rng: random.Random, n_steps: int, n_labels: int = 500) -> str:
+    labels = unique_names(rng, n_labels, min_length=2)
+    labels = [label[:rng.randint(2, len(label))] for label in labels]
+
+    steps = []
+    for _ in range(n_steps):
+        label = rng.choice(labels)
+        if rng.random() < 0.3:
+            steps.append(f"{label}-")
+        else:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+
+    return ",".join(steps) + "\n"
+
+
+def generate_day16(
+    rng: random.Random,
+    width: int,
+    height: int,
+    density: float = 0.1,
+) -> str:
+    rows = [
+        "".join(
+            rng.choice("/\\|-") if rng.random() < density else "."
+            for _ in range(width)
+        )
+        for _ in range(height)
+    ]
+    return "\n".join(rows) + "\n"
+
+
+def generate_day17(rng: random.Random, width: int, height: int) -> str:
+    rows = [
+        "".join(rng.choice("123456789") for _ in range(width))
+        for _ in range(height)
+    ]
+    return "\n".join(rows) + "\n"
+
+
+def _histogram_outline(
+    rng: random.Random,
+    n_columns: int,
+    max_height: int,
+    max_width: int,
+) -> list[tuple[str, int]]:
+    """Dig instructions tracing the outline of a random histogram."""
+    heights = [rng.randint(1, max_height)]
+    while len(heights) < n_columns:
+        h = rng.randint(1, max_height)
+        if h != heights[-1]:
+            heights.append(h)
+
+    widths = [rng.randint(1, max_width) for _ in range(n_columns)]
+
+    moves = [("U", heights[0])]
+    for idx in range(n_columns):
+        moves.append(("R", widths[idx]))
+
+        if idx + 1 < n_columns:
+            diff = heights[idx + 1] - heights[idx]
+            moves.append(("U" if diff > 0 else "D", abs(diff)))
+        else:
+            moves.append(("D", heights[idx]))
+
+    moves.append(("L", sum(widths)))
+
+    return moves
+
+
+def generate_day18(rng: random.Random, n_instructions: int) -> str:
+    n_columns = max(1, (n_instructions - 2) // 2)
+    max_encoded = 0xFFFFF
+
+    if n_columns > max_encoded:
+        raise ValueError(f"At most {2 * max_encoded + 2} instructions supported")
+
+    part_one = _histogram_outline(rng, n_columns, max_height=10, max_width=10)
+    part_two = _histogram_outline(
+        rng,
+        n_columns,
+        max_height=max_encoded,
+        max_width=max_encoded // n_columns,
+    )
+
+    lines = [
+        f"{d1} {n1} (#{n2:05x}{'RDLU'.index(d2)})"
+        for (d1, n1), (d2, n2) in zip(part_one, part_two)
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def generate_day19(
+    rng: random.Random,
+    n_workflows: int,
+    n_parts: int,
+    max_rules: int = 4,
+) -> str:
+    """Workflows form a tree rooted at "in", so no workflow is visited twice."""
+    names = ["in", *unique_names(rng, n_workflows - 1, exclude=("in",))]
+    next_child = 1
+
+    workflows = []
+    for name in names:
+        destinations = []
+        for _ in range(rng.randint(1, max_rules) + 1):
+            if next_child < len(names) and rng.random() < 0.6:
+                destinations.append(names[next_child])
+                next_child += 1
+            else:
+                destinations.append(rng.choice("AR"))
+
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(2, 3999)}:{dst}"
+            for dst in destinations[:-1]
+        ]
+        workflows.append(f"{name}{{{','.join([*rules, destinations[-1]])}}}")
+
+    parts = [
+        "{" + ",".join(f"{p}={rng.randint(1, 4000)}" for p in "xmas") + "}"
+        for _ in range(n_parts)
+    ]
+
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts) + "\n"
+
+
+def generate_day20(rng: random.Random, n_counters: int, n_bits: int = 12) -> str:
+    """Each counter is a chain of flip-flops with a conjunction which fires
+    (and resets the counter) every `period` button presses; all counters
+    feed (through inverters) the conjunction in front of "rx"."""
+    names = unique_names(rng, n_counters * (n_bits + 2) + 1)
+    final, names = names[0], iter(names[1:])
+
+    lines = [f"&{final} -> rx"]
+    broadcast = []
+
+    for _ in range(n_counters):
+        period = rng.randrange(2 ** (n_bits - 1), 2 ** n_bits) | 1
+        flip_flops = [next(names) for _ in range(n_bits)]
+        conjunction, inverter = next(names), next(names)
+
+        conjunction_outputs = [flip_flops[0]]
+        for bit, flip_flop in enumerate(flip_flops):
+            outputs = flip_flops[bit + 1:bit + 2]
+
+            if period >> bit & 1:
+                outputs.append(conjunction)
+            else:
+                conjunction_outputs.append(flip_flop)
+
+            lines.append(f"%{flip_flop} -> {', '.join(outputs)}")
+
+        conjunction_outputs.append(inverter)
+        lines.append(f"&{conjunction} -> {', '.join(conjunction_outputs)}")
+        lines.append(f"&{inverter} -> {final}")
+
+        broadcast.append(flip_flops[0])
+
+    rng.shuffle(lines)
+    lines.insert(rng.randint(0, len(lines)), f"broadcaster -> {', '.join(broadcast)}")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day21(rng: random.Random, size: int, rock_rate: float = 0.15) -> str:
+    """Keeps the middle row and column, the border and the diamond around
+    "S" free of rocks (as the geometric solution of part two expects)."""
+    size = max(size, 5) | 1
+    mid = size // 2
+
+    def _is_free(i: int, j: int) -> bool:
+        return (
+            i in (0, mid, size - 1)
+            or j in (0, mid, size - 1)
+            or abs(abs(i - mid) + abs(j - mid) - mid) <= 1
+        )
+
+    grid = [
+        [
+            "." if _is_free(i, j) or rng.random() >= rock_rate else "#"
+            for j in range(size)
+        ]
+        for i in range(size)
+    ]
+    grid[mid][mid] = "S"
+
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def generate_day22(
+    rng: random.Random,
+    n_bricks: int,
+    width: int = 10,
+    max_length: int = 4,
+) -> str:
+    max_z = max(2, n_bricks * 30 // width ** 2)
+    occupied = set()
+    lines = []
+
+    while len(lines) < n_bricks:
+        axis = rng.randrange(3)
+        length = rng.randint(1, max_length)
+
+        start = [rng.randrange(width), rng.randrange(width), rng.randint(1, max_z)]
+        if axis < 2:
+            start[axis] = rng.randrange(width - length + 1)
+
+        end = list(start)
+        end[axis] += length - 1
+
+        cubes = set(itertools.product(*[range(s, e + 1) for s, e in zip(start, end)]))
+        if cubes & occupied:
+            continue
+
+        occupied |= cubes
+        lines.append(f"{','.join(map(str, start))}~{','.join(map(str, end))}")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day23(
+    rng: random.Random,
+    corridor_length: int,
+    n_junctions: int = 6,
+) -> str:
+    """A lattice of junctions joined by straight corridors, with slopes
+    leading right/down (so part one's graph is acyclic)."""
+    corridor_length = max(corridor_length, 3)
+
+    def _coords() -> list[int]:
+        coords = [1]
+        for _ in range(n_junctions - 1):
+            coords.append(
+                coords[-1] + rng.randint(max(3, corridor_length // 2), corridor_length)
+            )
+        return coords
+
+    rows, cols = _coords(), _coords()
+    height, width = rows[-1] + 2, cols[-1] + 2
+
+    grid = [["#"] * width for _ in range(height)]
+
+    for r in rows:
+        for c in range(cols[0], cols[-1] + 1):
+            grid[r][c] = "."
+        for c0, c1 in zip(cols, cols[1:]):
+            grid[r][c0 + 1] = grid[r][c1 - 1] = ">"
+
+    for c in cols:
+        for r in range(rows[0], rows[-1] + 1):
+            if grid[r][c] == "#":
+                grid[r][c] = "."
+        for r0, r1 in zip(rows, rows[1:]):
+            grid[r0 + 1][c] = grid[r1 - 1][c] = "v"
+
+    grid[0][cols[0]] = "."
+    grid[-1][cols[-1]] = "."
+
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def generate_day24(
+    rng: random.Random,
+    n_hailstones: int,
+    max_velocity: int = 300,
+) -> str:
+    """All hailstones are hit (at distinct times) by the same rock throw."""
+    rock_pos = [rng.randint(2 * 10 ** 14, 3 * 10 ** 14) for _ in range(3)]
+    rock_vel = [rng.randint(-max_velocity, max_velocity) for _ in range(3)]
+
+    lines = []
+    for t in rng.sample(range(10 ** 10, 3 * 10 ** 11), n_hailstones):
+        vel = rock_vel
+        while vel == rock_vel:
+            vel = [rng.randint(-max_velocity, max_velocity) for _ in range(3)]
+
+        pos = [p + t * (rv - v) for p, rv, v in zip(rock_pos, rock_vel, vel)]
+        lines.append(
+            f"{', '.join(map(str, pos))} @ {', '.join(map(str, vel))}"
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day25(rng: random.Random, n_nodes: int, extra_edges: int = 1) -> str:
+    """Two 4-edge-connected clusters joined by exactly three edges."""
+    names = unique_names(rng, max(n_nodes, 10), min_length=3)
+    half = len(names) // 2
+
+    edges = {}
+
+    def _add_edge(a: str, b: str):
+        edges[tuple(sorted((a, b)))] = None
+
+    for cluster in (names[:half], names[half:]):
+        for idx, name in enumerate(cluster):
+            _add_edge(name, cluster[(idx + 1) % len(cluster)])
+            _add_edge(name, cluster[(idx + 2) % len(cluster)])
+
+        for _ in range(extra_edges * len(cluster)):
+            _add_edge(*rng.sample(cluster, 2))
+
+    for a, b in zip(rng.sample(names[:half], 3), rng.sample(names[half:], 3)):
+        _add_edge(a, b)
+
+    adjacency = {}
+    for a, b in edges:
+        src, dst = (a, b) if rng.random() < 0.5 else (b, a)
+        adjacency.setdefault(src, []).append(dst)
+
+    lines = [f"{src}: {' '.join(dsts)}" for src, dsts in adjacency.items()]
+    rng.shuffle(lines)
+
+    return "\n".join(lines) + "\n"
+
+
+GENERATORS: dict[int, Generator] = {
+    1: Generator(generate_day01, {"n_lines": 1_000}),
+    2: Generator(generate_day02, {"n_games": 100}),
+    3: Generator(generate_day03, {"width": 140, "height": 140}),
+    4: Generator(generate_day04, {"n_cards": 200}),
+    5: Generator(generate_day05, {"n_seed_pairs": 10, "n_ranges": 30}),
+    6: Generator(generate_day06, {"n_races": 4}),
+    7: Generator(generate_day07, {"n_hands": 1_000}),
+    8: Generator(generate_day08, {"n_nodes": 750}),
+    9: Generator(generate_day09, {"n_histories": 200}),
+    10: Generator(generate_day10, {"width": 140, "height": 140}),
+    11: Generator(generate_day11, {"width": 140, "height": 140}),
+    12: Generator(generate_day12, {"n_rows": 1_000}),
+    13: Generator(generate_day13, {"n_patterns": 100}),
+    14: Generator(generate_day14, {"width": 100, "height": 100}),
+    15: Generator(generate_day15, {"n_steps": 4_000}),
+    16: Generator(generate_day16, {"width": 110, "height": 110}),
+    17: Generator(generate_day17, {"width": 141, "height": 141}),
+    18: Generator(generate_day18, {"n_instructions": 700}),
+    19: Generator(generate_day19, {"n_workflows": 550, "n_parts": 200}),
+    20: Generator(generate_day20, {"n_counters": 4}),
+    21: Generator(generate_day21, {"size": 131}),
+    22: Generator(generate_day22, {"n_bricks": 1_200}),
+    23: Generator(generate_day23, {"corridor_length": 20}),
+    24: Generator(generate_day24, {"n_hailstones": 300}),
+    25: Generator(generate_day25, {"n_nodes": 1_500}),
+}
+
+
+def scaled_sizes(sizes: dict[str, int], scale: float) -> dict[str, int]:
+    return {
+        name: max(1, round(value * (math.sqrt(scale) if name in LINEAR_SIZES else scale)))
+        for name, value in sizes.items()
+    }
+
+
+def generate(day: int, scale: float = 1.0, seed: int = 0) -> str:
+    generator = GENERATORS[day]
+    rng = random.Random(seed)
+    return generator.fn(rng, **scaled_sizes(generator.sizes, scale))
+
+
+def input_name(scale: float, seed: int) -> str:
+    return f"generated_x{scale:g}_seed{seed}.txt"
+
+
+def write_input(day: int, scale: float = 1.0, seed: int = 0) -> Path:
+    """Writes a generated input next to the day's puzzle input."""
+    path = ROOT_DIR / f"day{day:02d}" / "data" / input_name(scale, seed)
+    path.parent.mkdir(exist_ok=True)
+
+    with open(path, "w") as fout:
+        fout.write(generate(day, scale=scale, seed=seed))
+
+    return path
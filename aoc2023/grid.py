@@ -0,0 +1,318 @@
+"""Compact 2-D grids of byte-sized cells"""
+import mmap
+import zlib
+from typing import Iterable, Iterator
+
+from aoc2023.inputs import read_records
+from aoc2023.numeric import np
+
+
+Cell = tuple[int, int]  # (row, column)
+
+OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+DIAGONAL_OFFSETS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def _strided(
+    cells: bytearray | mmap.mmap, start: int, step: int, length: int,
+) -> memoryview:
+    return memoryview(cells)[start:start + step * length:step]
+
+
+class Grid:
+    """Rectangular grid of uint8 cells stored in one flat buffer.
+
+    Cell (row, col) is stored at `offset + row * row_stride + col * col_stride`,
+    so transposed and flipped grids are views sharing the buffer of the
+    original grid (writes to a view are visible in the original).
+    """
+
+    __slots__ = ("cells", "height", "width", "offset", "row_stride", "col_stride")
+
+    def __init__(
+        self,
+        cells: bytearray | mmap.mmap,
+        height: int,
+        width: int,
+        offset: int = 0,
+        row_stride: int | None = None,
+        col_stride: int = 1,
+    ):
+        self.cells = cells
+        self.height = height
+        self.width = width
+        self.offset = offset
+        self.row_stride = width if row_stride is None else row_stride
+        self.col_stride = col_stride
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[str | bytes]) -> "Grid":
+        cells = bytearray()
+        height, width = 0, None
+
+        for row in rows:
+            if isinstance(row, str):
+                row = row.encode()
+
+            if width is None:
+                width = len(row)
+            elif len(row) != width:
+                raise ValueError(
+                    f"Row {height} has {len(row)} cells, expected {width}"
+                )
+
+            cells += row
+            height += 1
+
+        return cls(cells, height, width or 0)
+
+    @classmethod
+    def read(cls, path: str) -> "Grid":
+        return cls.from_rows(read_records(path))
+
+    @classmethod
+    def map_file(cls, path: str) -> "Grid":
+        """Memory-maps the file and uses it as the cells without copying,
+        skipping line endings through the row stride.
+
+        The mapping is copy-on-write: the grid can be modified, but the
+        changes are never written back to the file.
+        """
+        with open(path, "rb") as fin:
+            try:
+                cells = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_COPY)
+            except ValueError:  # Empty file
+                return cls(bytearray(), 0, 0)
+
+        # Trailing empty lines are ignored
+        end = len(cells)
+        while end > 0 and cells[end - 1] in b"\r\n":
+            end -= 1
+
+        if end == 0:
+            return cls(bytearray(), 0, 0)
+
+        row_stride = cells.find(b"\n") + 1 or len(cells) + 1
+        width = row_stride - 1
+        if width > 0 and cells[width - 1] == ord("\r"):
+            width -= 1
+
+        # Without the last row's line ending
+        height = (end + row_stride - width) // row_stride
+        n_endings = height - 1
+
+        if (
+            end != height * row_stride - (row_stride - width)
+            or _strided(cells, row_stride - 1, row_stride, n_endings) != b"\n" * n_endings
+            or (
+                width < row_stride - 1
+                and _strided(cells, width, row_stride, n_endings) != b"\r" * n_endings
+            )
+            # Shorter rows and longer ones can add up to a valid size
+            or any(
+                cells.find(b"\n", start, start + width) != -1
+                for start in range(0, end, row_stride)
+            )
+        ):
+            raise ValueError(f"Rows of {path} have different lengths")
+
+        return cls(cells, height, width, row_stride=row_stride)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.height, self.width
+
+    def index(self, row: int, col: int) -> int:
+        """Position of the cell in the flat buffer."""
+        return self.offset + row * self.row_stride + col * self.col_stride
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def __getitem__(self, cell: Cell) -> int:
+        row, col = cell
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise IndexError(f"{cell} is outside of a {self.height}x{self.width} grid")
+        return self.cells[self.offset + row * self.row_stride + col * self.col_stride]
+
+    def __setitem__(self, cell: Cell, value: int):
+        row, col = cell
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise IndexError(f"{cell} is outside of a {self.height}x{self.width} grid")
+        self.cells[self.offset + row * self.row_stride + col * self.col_stride] = value
+
+    def get(self, cell: Cell, default: int | None = None) -> int | None:
+        row, col = cell
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            return default
+        return self.cells[self.offset + row * self.row_stride + col * self.col_stride]
+
+    def _line(self, start: int, step: int, length: int) -> memoryview:
+        stop = start + step * length
+        return memoryview(self.cells)[start:stop if stop >= 0 else None:step]
+
+    def row(self, row: int) -> memoryview:
+        if not 0 <= row < self.height:
+            raise IndexError(f"Row {row} is outside of a {self.height}x{self.width} grid")
+        return self._line(self.index(row, 0), self.col_stride, self.width)
+
+    def col(self, col: int) -> memoryview:
+        if not 0 <= col < self.width:
+            raise IndexError(f"Column {col} is outside of a {self.height}x{self.width} grid")
+        return self._line(self.index(0, col), self.row_stride, self.height)
+
+    def rows(self) -> Iterator[memoryview]:
+        return (self.row(row) for row in range(self.height))
+
+    def cols(self) -> Iterator[memoryview]:
+        return (self.col(col) for col in range(self.width))
+
+    def transpose(self) -> "Grid":
+        return Grid(
+            self.cells,
+            height=self.width,
+            width=self.height,
+            offset=self.offset,
+            row_stride=self.col_stride,
+            col_stride=self.row_stride,
+        )
+
+    def flip_rows(self) -> "Grid":
+        """Upside-down view (the last row comes first)."""
+        return Grid(
+            self.cells,
+            height=self.height,
+            width=self.width,
+            offset=self.index(self.height - 1, 0),
+            row_stride=-self.row_stride,
+            col_stride=self.col_stride,
+        )
+
+    def flip_cols(self) -> "Grid":
+        """Mirrored view (the last column comes first)."""
+        return Grid(
+            self.cells,
+            height=self.height,
+            width=self.width,
+            offset=self.index(0, self.width - 1),
+            row_stride=self.row_stride,
+            col_stride=-self.col_stride,
+        )
+
+    def neighbours(self, row: int, col: int, diagonal: bool = False) -> Iterator[Cell]:
+        offsets = (*OFFSETS, *DIAGONAL_OFFSETS) if diagonal else OFFSETS
+
+        for d_row, d_col in offsets:
+            n_row, n_col = row + d_row, col + d_col
+            if 0 <= n_row < self.height and 0 <= n_col < self.width:
+                yield n_row, n_col
+
+    def find_all(self, value: int) -> Iterator[Cell]:
+        for row_idx, row in enumerate(self.rows()):
+            row = bytes(row)
+            col_idx = row.find(value)
+
+            while col_idx != -1:
+                yield row_idx, col_idx
+                col_idx = row.find(value, col_idx + 1)
+
+    def find(self, value: int) -> Cell | None:
+        return next(self.find_all(value), None)
+
+    def count(self, value: int) -> int:
+        return sum(bytes(row).count(value) for row in self.rows())
+
+    def tobytes(self) -> bytes:
+        """Row-major copy of the cells."""
+        if self.col_stride == 1:
+            return b"".join(self.rows())
+        return b"".join(bytes(row) for row in self.rows())
+
+    def copy(self) -> "Grid":
+        """Grid with its own contiguous (row-major) buffer."""
+        return Grid(bytearray(self.tobytes()), self.height, self.width)
+
+    def as_array(self):
+        """NumPy uint8 array sharing memory with the grid."""
+        if np is None:
+            raise ImportError("Grid.as_array needs NumPy")
+
+        return np.ndarray(
+            shape=self.shape,
+            dtype=np.uint8,
+            buffer=self.cells,
+            offset=self.offset,
+            strides=(self.row_stride, self.col_stride),
+        )
+
+    def __reduce__(self):
+        # Pickles only the cells of the grid (memory maps can't be pickled)
+        return Grid, (bytearray(self.tobytes()), self.height, self.width)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.shape == other.shape and all(
+            a == b for a, b in zip(self.rows(), other.rows())
+        )
+
+    def __hash__(self) -> int:
+        # Only strided rows (e.g. of transposed views) are copied for hashing.
+        # Like any key, a grid must not be modified while stored in a dict.
+        crc = zlib.crc32(f"{self.height}x{self.width}".encode())
+
+        for row in self.rows():
+            crc = zlib.crc32(row if self.col_stride == 1 else bytes(row), crc)
+
+        return crc
+
+    def __str__(self) -> str:
+        return "\n".join(bytes(row).decode() for row in self.rows())
+
+
+def run_tests():
+    import os
+    import tempfile
+
+    def _map(content: bytes) -> Grid:
+        with tempfile.NamedTemporaryFile(delete=False) as fout:
+            fout.write(content)
+        try:
+            return Grid.map_file(fout.name)
+        finally:
+            os.unlink(fout.name)
+
+    for content in (
+        b"ab\ncd\nef\n",
+        b"ab\r\ncd\r\nef\r\n",
+        b"ab\ncd\nef",
+        b"ab\r\ncd\r\nef",
+        b"ab\ncd\nef\n\n\n",
+        b"ab\r\ncd\r\nef\r\n\r\n",
+    ):
+        grid = _map(content)
+        assert grid.shape == (3, 2), content
+        assert [bytes(row) for row in grid.rows()] == [b"ab", b"cd", b"ef"], content
+
+    assert _map(b"abc").shape == (1, 3)
+    assert _map(b"").shape == _map(b"\n\n").shape == (0, 0)
+
+    for content in (
+        b"ab\nc\n",
+        b"abc\nab\n",
+        b"ab\ncde\n",
+        b"ab\n\nc\n",
+        b"ab\n\nc\nde",
+        b"ab\ncdxef",
+        b"ab\r\ncd\nef",
+    ):
+        try:
+            _map(content)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{content} should be rejected")
+
+
+if __name__ == "__main__":
+    run_tests()
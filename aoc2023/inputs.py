@@ -0,0 +1,44 @@
+"""Streaming readers of puzzle inputs"""
+from typing import Iterator
+
+
+def read_records(
+    path: str,
+    separator: str = "\n",
+    chunk_size: int = 2 ** 16,
+) -> Iterator[str]:
+    """Lazily yields the stripped records of a file split by `separator`
+    (lines by default), reading the file in fixed-size chunks."""
+    # A separator can span chunks, so each chunk is split together with the
+    # last `overlap` characters of the pending record (without re-splitting
+    # the whole record, which would be quadratic for long records)
+    overlap = len(separator) - 1
+
+    with open(path, "r") as fin:
+        pending = []  # Pieces of the current record
+
+        while chunk := fin.read(chunk_size):
+            if overlap:
+                tail = ""
+                while pending and len(tail) < overlap:
+                    tail = pending.pop() + tail
+
+                if len(tail) > overlap:
+                    pending.append(tail[:-overlap])
+                    tail = tail[-overlap:]
+
+                chunk = tail + chunk
+
+            first, *records = chunk.split(separator)
+            pending.append(first)
+
+            if records:
+                yield "".join(pending).strip()
+                pending = [records.pop()]
+
+                for record in records:
+                    yield record.strip()
+
+        last = "".join(pending).strip()
+        if last:
+            yield last
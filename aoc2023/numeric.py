@@ -0,0 +1,9 @@
+"""Optional NumPy support
+
+Solvers with a vectorized path use `np` if NumPy is installed, and fall back
+to pure Python if it's None.
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
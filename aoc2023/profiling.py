@@ -0,0 +1,246 @@
+"""cProfile and tracemalloc instrumentation of the runner's stages"""
+import contextlib
+import cProfile
+import linecache
+import pstats
+import threading
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+def _label(func: tuple[str, int, str]) -> str:
+    filename, lineno, name = func
+    if filename == "~":  # Built-ins
+        return name
+    return f"{name} ({Path(filename).name}:{lineno})"
+
+
+def collapsed_stacks(stats: pstats.Stats, max_depth: int = 64) -> dict[str, int]:
+    """Folds the profile into "frame;frame;frame" -> self time [us].
+
+    cProfile only records caller -> callee edges (not full stacks), so the
+    time of a function called from several places is split between its
+    callers proportionally to the time spent in each call edge.
+    """
+    callees = defaultdict(dict)
+    roots = []
+
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        if not callers:
+            roots.append(func)
+        for caller, (_, _, _, cumtime) in callers.items():
+            callees[caller][func] = cumtime
+
+    folded = defaultdict(float)
+
+    def _walk(func, inclusive: float, stack: list[str], on_stack: set):
+        _, _, tottime, cumtime, _ = stats.stats[func]
+        ratio = inclusive / cumtime if cumtime > 0 else 0.0
+        stack = [*stack, _label(func)]
+
+        folded[";".join(stack)] += tottime * ratio
+
+        if len(stack) >= max_depth:
+            return
+
+        for callee, edge_time in callees[func].items():
+            if callee in on_stack or edge_time * ratio < 1e-6:
+                continue
+            _walk(callee, edge_time * ratio, stack, on_stack | {callee})
+
+    for root in roots:
+        _walk(root, stats.stats[root][3], [], {root})
+
+    return {
+        stack: round(seconds * 1e6)
+        for stack, seconds in folded.items()
+        if round(seconds * 1e6) > 0
+    }
+
+
+def top_functions(stats: pstats.Stats, n: int = 5) -> list[tuple[str, float]]:
+    """Functions with the highest internal time (excluding callees)."""
+    ranked = sorted(stats.stats.items(), key=lambda item: -item[1][2])
+    return [(_label(func), tottime) for func, (_, _, tottime, _, _) in ranked[:n]]
+
+
+class Profiler:
+    """Profiles each stage, writing `.pstats` and collapsed-stack files."""
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = Path(output_dir)
+        self.summaries: list[tuple[int, str, list[tuple[str, float]]]] = []
+
+    @contextlib.contextmanager
+    def __call__(self, day: int, stage: str) -> Iterator[None]:
+        profile = cProfile.Profile()
+        profile.enable()
+
+        try:
+            yield
+        finally:
+            profile.disable()
+
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            stem = self.output_dir / f"day{day:02d}_{stage}"
+
+            stats = pstats.Stats(profile)
+            stats.dump_stats(f"{stem}.pstats")
+
+            with open(f"{stem}.collapsed", "w") as fout:
+                for stack, micros in collapsed_stacks(stats).items():
+                    fout.write(f"{stack} {micros}\n")
+
+            self.summaries.append((day, stage, top_functions(stats)))
+
+    def format_summary(self) -> str:
+        lines = [f"Profiles written to {self.output_dir}/"]
+
+        for day, stage, functions in self.summaries:
+            lines.append(f"day{day:02d}  {stage}")
+            for label, tottime in functions:
+                lines.append(f"    {tottime * 1e3:>10.3f} ms  {label}")
+
+        return "\n".join(lines)
+
+
+class MemoryStats(NamedTuple):
+    day: int
+    stage: str
+    peak_bytes: int
+    top_lines: list[tuple[str, int, int]]  # (location, size, count)
+
+
+class MemoryTracer:
+    """Records each stage's peak allocation and the lines which allocated
+    the most memory at (about) that peak.
+
+    A background thread samples the traced memory every `interval` seconds
+    and keeps the allocations by line of the largest sample, or those at the
+    end of the stage if it's larger (so peaks of temporaries shorter than the
+    interval can be missed). Allocations are attributed to the innermost
+    frame in a day's solver or in the helpers it uses, others are ignored.
+    """
+
+    def __init__(self, top: int = 10, interval: float = 0.005, n_frames: int = 4):
+        self.top = top
+        self.interval = interval
+        self.n_frames = n_frames
+        self.stats: list[MemoryStats] = []
+        self._is_solver_file: dict[str, bool] = {}
+
+    @contextlib.contextmanager
+    def __call__(self, day: int, stage: str) -> Iterator[None]:
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start(self.n_frames)
+
+        before = self._lines(tracemalloc.take_snapshot())
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+
+        peak = sampled = baseline
+        peak_lines = before
+        done = threading.Event()
+
+        def _sample():
+            nonlocal peak, sampled, peak_lines
+
+            while not done.wait(self.interval):
+                current, stage_peak = tracemalloc.get_traced_memory()
+                peak = max(peak, stage_peak)
+
+                # Snapshots are slow, so only taken after a large enough growth
+                if current - baseline > (sampled - baseline) * 5 // 4 + 2**16:
+                    peak_lines = self._lines(tracemalloc.take_snapshot())
+                    sampled = current
+                    # Leaves out the snapshot's own allocations
+                    tracemalloc.reset_peak()
+
+        sampler = threading.Thread(target=_sample, daemon=True)
+        sampler.start()
+
+        try:
+            yield
+        finally:
+            done.set()
+            sampler.join()
+
+            current, stage_peak = tracemalloc.get_traced_memory()
+            peak = max(peak, stage_peak)
+            if current >= sampled:
+                peak_lines = self._lines(tracemalloc.take_snapshot())
+
+            if started:
+                tracemalloc.stop()
+
+            top_lines = []
+            for location, (size, count) in peak_lines.items():
+                size_before, count_before = before.get(location, (0, 0))
+                if size > size_before:
+                    top_lines.append(
+                        (location, size - size_before, count - count_before)
+                    )
+            top_lines = sorted(top_lines, key=lambda line: -line[1])[:self.top]
+
+            self.stats.append(
+                MemoryStats(day, stage, peak - baseline, top_lines)
+            )
+
+    def _lines(self, snapshot: tracemalloc.Snapshot) -> dict[str, tuple[int, int]]:
+        """Allocated (size, count) by innermost solver line."""
+        lines = defaultdict(lambda: (0, 0))
+
+        for stat in snapshot.statistics("traceback"):
+            for frame in reversed(stat.traceback):  # Innermost first
+                if self._is_solver(frame.filename):
+                    location = f"{frame.filename}:{frame.lineno}"
+                    size, count = lines[location]
+                    lines[location] = (size + stat.size, count + stat.count)
+                    break
+
+        return dict(lines)
+
+    def _is_solver(self, filename: str) -> bool:
+        if filename not in self._is_solver_file:
+            path = Path(filename).resolve()
+
+            self._is_solver_file[filename] = (
+                path.parent.parent == ROOT_DIR
+                and path.parent.name.startswith("day")
+            ) or (
+                path.parent == ROOT_DIR / "aoc2023"
+                and path.name not in ("profiling.py", "runner.py", "__main__.py")
+            )
+
+        return self._is_solver_file[filename]
+
+    def format_summary(self) -> str:
+        lines = []
+
+        for s in self.stats:
+            lines.append(
+                f"day{s.day:02d}  {s.stage:<15} peak {_format_size(s.peak_bytes)}"
+            )
+            for location, size, count in s.top_lines:
+                filename, lineno = location.rsplit(":", 1)
+                code = linecache.getline(filename, int(lineno)).strip()
+                lines.append(
+                    f"    {_format_size(size):>10} {count:>8} blocks  "
+                    f"{Path(filename).parent.name}/{Path(filename).name}:{lineno}  {code}"
+                )
+
+        return "\n".join(lines)
+
+
+def _format_size(num_bytes: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GiB"
@@ -0,0 +1,141 @@
+"""Machine-readable (JSON Lines / CSV) reports of the runner's results"""
+import csv
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Any, Iterable, NamedTuple, TextIO
+
+from aoc2023.cache import update_digest
+from aoc2023.profiling import MemoryStats
+from aoc2023.runner import StageResult, load_day
+
+
+FORMATS = ("jsonl", "csv")
+
+
+class PartReport(NamedTuple):
+    timestamp: str
+    day: int
+    part: int
+    answer: Any
+    parse_seconds: float | None  # None if all answers came from the cache
+    solve_seconds: float
+    cached: bool
+    parse_peak_bytes: int | None  # None unless memory was traced
+    solve_peak_bytes: int | None
+    input_sha256: str
+
+
+def input_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    update_digest(digest, path)
+    return digest.hexdigest()
+
+
+def build_reports(
+    results: list[StageResult],
+    input_name: str = "input.txt",
+    memory_stats: Iterable[MemoryStats] = (),
+) -> list[PartReport]:
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    parse_results = {r.day: r for r in results if r.stage == "parse_input"}
+    peaks = {(s.day, s.stage): s.peak_bytes for s in memory_stats}
+    digests = {}
+
+    reports = []
+
+    for r in results:
+        if r.stage == "parse_input":
+            continue
+
+        if r.day not in digests:
+            path = load_day(r.day).data_dir / input_name
+            digests[r.day] = input_digest(path)
+
+        parse_result = parse_results.get(r.day)
+
+        reports.append(PartReport(
+            timestamp=timestamp,
+            day=r.day,
+            part=1 if r.stage == "solve_part_one" else 2,
+            answer=r.answer,
+            parse_seconds=None if parse_result is None else parse_result.seconds,
+            solve_seconds=r.seconds,
+            cached=r.cached,
+            parse_peak_bytes=peaks.get((r.day, "parse_input")),
+            solve_peak_bytes=peaks.get((r.day, r.stage)),
+            input_sha256=digests[r.day],
+        ))
+
+    return reports
+
+
+def write_jsonl(reports: list[PartReport], fout: TextIO):
+    for report in reports:
+        fout.write(json.dumps(report._asdict(), default=str) + "\n")
+
+
+def write_csv(reports: list[PartReport], fout: TextIO):
+    writer = csv.writer(fout, lineterminator="\n")
+    writer.writerow(PartReport._fields)
+    writer.writerows(reports)
+
+
+def write_report(reports: list[PartReport], fout: TextIO, fmt: str = "jsonl"):
+    if fmt == "jsonl":
+        write_jsonl(reports, fout)
+    elif fmt == "csv":
+        write_csv(reports, fout)
+    else:
+        raise ValueError(f"Unknown report format: '{fmt}'")
+
+
+def run_tests():
+    import io
+
+    results = [
+        StageResult(1, "parse_input", None, 0.5),
+        StageResult(1, "solve_part_one", 142, 0.25),
+        StageResult(1, "solve_part_two", 281, 0.125, cached=True),
+    ]
+    memory_stats = [
+        MemoryStats(1, "parse_input", 1024, []),
+        MemoryStats(1, "solve_part_one", 2048, []),
+    ]
+
+    reports = build_reports(results, "example.txt", memory_stats)
+    digest = input_digest(load_day(1).data_dir / "example.txt")
+
+    assert [(r.day, r.part, r.answer, r.cached) for r in reports] == [
+        (1, 1, 142, False), (1, 2, 281, True),
+    ]
+    assert [(r.parse_seconds, r.solve_seconds) for r in reports] == [
+        (0.5, 0.25), (0.5, 0.125),
+    ]
+    assert [(r.parse_peak_bytes, r.solve_peak_bytes) for r in reports] == [
+        (1024, 2048), (1024, None),
+    ]
+    assert all(r.input_sha256 == digest for r in reports)
+    assert len({r.timestamp for r in reports}) == 1
+
+    # Without a parse (all the answers cached), there's no parse time
+    assert build_reports(results[1:], "example.txt")[0].parse_seconds is None
+
+    fout = io.StringIO()
+    write_report(reports, fout, fmt="jsonl")
+    rows = [json.loads(line) for line in fout.getvalue().splitlines()]
+    assert rows == [report._asdict() for report in reports]
+
+    fout = io.StringIO()
+    write_report(reports, fout, fmt="csv")
+    header, *rows = csv.reader(io.StringIO(fout.getvalue()))
+    assert header == list(PartReport._fields)
+    assert rows == [
+        ["" if value is None else str(value) for value in report]
+        for report in reports
+    ]
+
+
+if __name__ == "__main__":
+    run_tests()
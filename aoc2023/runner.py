@@ -0,0 +1,381 @@
+"""Runs the daily solutions in a single process"""
+import importlib
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, ContextManager, Iterator, NamedTuple
+
+from aoc2023.cache import Cache
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+ALL_DAYS = list(range(1, 26))
+STAGES = ("parse_input", "solve_part_one", "solve_part_two")
+
+# Extra solver arguments (the same as passed in each day's `main()`)
+SOLVER_KWARGS: dict[tuple[int, str], dict[str, Any]] = {
+    (11, "solve_part_two"): {"expansion_rate": 1_000_000},
+    (24, "solve_part_one"): {
+        "val_min": 200_000_000_000_000,
+        "val_max": 400_000_000_000_000,
+    },
+}
+
+# Solvers which modify the parsed input, so each part needs a fresh copy
+MUTATING_DAYS = {20, 25}
+
+# Wraps the execution of a stage, called with the day number and stage name
+StageHook = Callable[[int, str], ContextManager[None]]
+
+
+class Day(NamedTuple):
+    number: int
+    module: ModuleType
+
+    @property
+    def name(self) -> str:
+        return f"day{self.number:02d}"
+
+    @property
+    def data_dir(self) -> Path:
+        return Path(self.module.__file__).parent / "data"
+
+    def solvers(self) -> list[str]:
+        return [s for s in STAGES[1:] if hasattr(self.module, s)]
+
+    def sources(self) -> list[str]:
+        """The solver's source file and the shared modules it (indirectly)
+        imports from."""
+        shared = set()
+        to_visit = [self.module]
+
+        while to_visit:
+            module = to_visit.pop()
+
+            for value in vars(module).values():
+                name = (
+                    getattr(value, "__module__", None)
+                    or getattr(value, "__name__", None)
+                    or ""
+                )
+                if (
+                    name.startswith(f"{__package__}.")
+                    and name in sys.modules
+                    and sys.modules[name].__file__ not in shared
+                ):
+                    shared.add(sys.modules[name].__file__)
+                    to_visit.append(sys.modules[name])
+
+        return [self.module.__file__, *sorted(shared)]
+
+
+class StageResult(NamedTuple):
+    day: int
+    stage: str
+    answer: Any
+    seconds: float
+    cached: bool = False
+
+
+def parse_days(spec: str) -> list[int]:
+    """Parses day selections like "1-25" or "1,3,5-7"."""
+    days = set()
+
+    for chunk in spec.split(","):
+        if "-" in chunk:
+            first, last = chunk.split("-")
+            days.update(range(int(first), int(last) + 1))
+        else:
+            days.add(int(chunk))
+
+    unknown = days - set(ALL_DAYS)
+    if unknown:
+        raise ValueError(f"Unknown days: {sorted(unknown)}")
+
+    return sorted(days)
+
+
+def load_day(number: int) -> Day:
+    if str(ROOT_DIR) not in sys.path:
+        sys.path.insert(0, str(ROOT_DIR))
+
+    module = importlib.import_module(f"day{number:02d}.main")
+    return Day(number=number, module=module)
+
+
+@contextmanager
+def instrumented(
+    hooks: tuple[StageHook, ...],
+    day: int,
+    stage: str,
+) -> Iterator[None]:
+    with ExitStack() as stack:
+        for hook in hooks:
+            stack.enter_context(hook(day, stage))
+        yield
+
+
+def parse_day(
+    day: Day,
+    path: str,
+    cache: Cache | None = None,
+    key: str = "",
+    hooks: tuple[StageHook, ...] = (),
+) -> tuple[Any, StageResult]:
+    if cache is not None:
+        start = time.perf_counter()
+        try:
+            data = cache.get(cache.parsed_key(key))
+        except KeyError:
+            pass
+        else:
+            elapsed = time.perf_counter() - start
+            return data, StageResult(day.number, "parse_input", None, elapsed, True)
+
+    with instrumented(hooks, day.number, "parse_input"):
+        start = time.perf_counter()
+        data = day.module.parse_input(path)
+        elapsed = time.perf_counter() - start
+
+    if cache is not None:
+        cache.put(cache.parsed_key(key), data)
+
+    return data, StageResult(day.number, "parse_input", None, elapsed)
+
+
+def solve_day(
+    day: Day,
+    stage: str,
+    data: Any,
+    cache: Cache | None = None,
+    key: str = "",
+    hooks: tuple[StageHook, ...] = (),
+) -> StageResult:
+    solver = getattr(day.module, stage)
+    kwargs = SOLVER_KWARGS.get((day.number, stage), {})
+
+    with instrumented(hooks, day.number, stage):
+        start = time.perf_counter()
+        answer = solver(data, **kwargs)
+        elapsed = time.perf_counter() - start
+
+    if cache is not None:
+        cache.put(cache.answer_key(key, stage, kwargs), answer)
+
+    return StageResult(day.number, stage, answer, elapsed)
+
+
+def cached_answer(
+    day: Day,
+    stage: str,
+    cache: Cache,
+    key: str,
+) -> StageResult | None:
+    kwargs = SOLVER_KWARGS.get((day.number, stage), {})
+
+    start = time.perf_counter()
+    try:
+        answer = cache.get(cache.answer_key(key, stage, kwargs))
+    except KeyError:
+        return None
+    elapsed = time.perf_counter() - start
+
+    return StageResult(day.number, stage, answer, elapsed, True)
+
+
+def run_day(
+    day: Day,
+    input_name: str = "input.txt",
+    cache: Cache | None = None,
+    hooks: tuple[StageHook, ...] = (),
+) -> list[StageResult]:
+    path = str(day.data_dir / input_name)
+    key = cache.day_key(path, *day.sources()) if cache is not None else ""
+
+    parse_result = None
+    results = []
+    data, needs_input = None, True
+
+    for stage in day.solvers():
+        if cache is not None:
+            hit = cached_answer(day, stage, cache, key)
+            if hit is not None:
+                results.append(hit)
+                continue
+
+        if needs_input:
+            data, r = parse_day(day, path, cache=cache, key=key, hooks=hooks)
+            parse_result = parse_result or r
+
+        results.append(
+            solve_day(day, stage, data, cache=cache, key=key, hooks=hooks)
+        )
+        needs_input = day.number in MUTATING_DAYS
+
+    if parse_result is not None:
+        results.insert(0, parse_result)
+
+    return results
+
+
+def load_days(days: list[int], input_name: str = "input.txt") -> list[Day]:
+    """Loads the given days, skipping those without the input file or whose
+    module can't be imported (e.g. because of a missing dependency)."""
+    loaded = []
+
+    for number in days:
+        name = f"day{number:02d}"
+
+        if not (ROOT_DIR / name / "data" / input_name).exists():
+            print(f"{name}: missing data/{input_name}, skipping", file=sys.stderr)
+            continue
+
+        try:
+            day = load_day(number)
+        except ImportError as e:
+            print(f"{name}: {e}, skipping", file=sys.stderr)
+            continue
+
+        loaded.append(day)
+
+    return loaded
+
+
+def run(
+    days: list[int],
+    input_name: str = "input.txt",
+    cache: Cache | None = None,
+    hooks: tuple[StageHook, ...] = (),
+) -> list[StageResult]:
+    results = []
+
+    for day in load_days(days, input_name=input_name):
+        results.extend(
+            run_day(day, input_name=input_name, cache=cache, hooks=hooks)
+        )
+
+    return results
+
+
+def _parse_task(
+    number: int,
+    path: str,
+    cache: Cache | None,
+    key: str,
+) -> tuple[Any, StageResult]:
+    return parse_day(load_day(number), path, cache=cache, key=key)
+
+
+def _solve_task(
+    number: int,
+    stage: str,
+    data: Any,
+    cache: Cache | None,
+    key: str,
+) -> StageResult:
+    return solve_day(load_day(number), stage, data, cache=cache, key=key)
+
+
+def run_parallel(
+    days: list[int],
+    input_name: str = "input.txt",
+    max_workers: int | None = None,
+    cache: Cache | None = None,
+) -> list[StageResult]:
+    """Runs days (and the parts of each day) in a process pool.
+
+    Every input is parsed once and the parsed data is sent to the workers
+    solving each part (each worker gets its own copy, so solvers modifying
+    the input don't need a fresh parse). Results are ordered by day and stage.
+    """
+    results = {}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        parse_futures = {}
+
+        for day in load_days(days, input_name=input_name):
+            path = str(day.data_dir / input_name)
+            key = ""
+            stages = day.solvers()
+
+            if cache is not None:
+                key = cache.day_key(path, *day.sources())
+
+                for stage in day.solvers():
+                    hit = cached_answer(day, stage, cache, key)
+                    if hit is not None:
+                        results[(day.number, stage)] = hit
+                        stages.remove(stage)
+
+            if stages:
+                future = pool.submit(_parse_task, day.number, path, cache, key)
+                parse_futures[future] = (day, stages, key)
+
+        solve_futures = []
+
+        for future in as_completed(parse_futures):
+            day, stages, key = parse_futures[future]
+            data, parse_result = future.result()
+            results[(day.number, "parse_input")] = parse_result
+
+            for stage in stages:
+                solve_futures.append(
+                    pool.submit(_solve_task, day.number, stage, data, cache, key)
+                )
+
+        for future in solve_futures:
+            r = future.result()
+            results[(r.day, r.stage)] = r
+
+    return [
+        results[key]
+        for key in sorted(results, key=lambda k: (k[0], STAGES.index(k[1])))
+    ]
+
+
+def format_results(results: list[StageResult]) -> str:
+    lines = [f"{'Day':<6} {'Stage':<15} {'Answer':>20} {'Time [ms]':>12}"]
+
+    for r in results:
+        answer = "-" if r.answer is None else str(r.answer)
+        lines.append(
+            f"day{r.day:02d}  {r.stage:<15} {answer:>20} {r.seconds * 1e3:>12.3f}"
+            + (" (cached)" if r.cached else "")
+        )
+
+    total = sum(r.seconds for r in results)
+    lines.append(f"Total: {total * 1e3:.3f} ms")
+
+    return "\n".join(lines)
+
+
+def run_tests():
+    assert parse_days("1-25") == ALL_DAYS
+    assert parse_days("5-7,1,3") == [1, 3, 5, 6, 7]
+    assert parse_days("2,2,1-2") == [1, 2]
+
+    for spec in ("0-2", "26", "3-x"):
+        try:
+            parse_days(spec)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"'{spec}' should be rejected")
+
+    # Whatever order the workers finish in, the results are ordered by day
+    # and stage, with the same answers as a serial run
+    expected = run([1, 2], input_name="example.txt")
+    results = run_parallel([2, 1], input_name="example.txt", max_workers=2)
+    assert [(r.day, r.stage, r.answer) for r in results] == [
+        (r.day, r.stage, r.answer) for r in expected
+    ]
+    assert [(r.day, r.stage) for r in results] == [
+        (day, stage) for day in (1, 2) for stage in STAGES
+    ]
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -1,4 +1,16 @@
 """Day 1"""
+import sys
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.inputs import read_records
+from aoc2023.numeric import np
+
 SPELLED_TO_DIGIT = {
     "one": "1",
     "two": "2",
@@ -11,74 +23,165 @@ SPELLED_TO_DIGIT = {
     "nine": "9",
 }
 
+NON_DIGIT_BYTES = bytes(c for c in range(256) if c not in b"0123456789\n")
+ZERO = ord("0")
+
 T_Data = list[str]
 
 
+def stream_input(path: str) -> Iterator[str]:
+    return read_records(path)
+
+
 def parse_input(path: str) -> T_Data:
-    with open(path, "r") as fin:
-        return [line.strip() for line in fin.readlines()]
+    return list(stream_input(path))
 
 
-def solve_part_one(data: T_Data) -> int:
-    digits = [
-        [c for c in line if c.isnumeric()]
-        for line in data
-    ]
-    numbers = [int(d[0] + d[-1]) for d in digits]
+def solve_part_one(data: Iterable[str], batch_size: int = 4096) -> int:
+    lines = iter(data)
+    answer = 0
+
+    while batch := list(islice(lines, batch_size)):
+        answer += calibration_sum("\n".join(batch).encode())
 
-    answer = sum(numbers)
     return answer
 
 
-def get_digit_positions(line: str) -> list[int]:
-    return [idx for idx, c in enumerate(line) if c.isnumeric()]
+def solve_part_one_file(path: str, chunk_size: int = 2 ** 20) -> int:
+    """Part one straight from the raw file, read in chunks of whole lines."""
+    answer = 0
+    pending = b""
 
+    with open(path, "rb") as fin:
+        while chunk := fin.read(chunk_size):
+            chunk = pending + chunk
+            end = chunk.rfind(b"\n") + 1
+
+            answer += calibration_sum(chunk[:end])
+            pending = chunk[end:]
 
-def find_first_spelled_digit(line: str) -> str:
-    d_pos = get_digit_positions(line)
+    return answer + calibration_sum(pending)
 
-    if not d_pos:
-        end = len(line)
-    else:
-        end = d_pos[0]
 
-    i = 0
-    while i <= end:
-        for spelled, digit in SPELLED_TO_DIGIT.items():
-            if spelled in line[:i]:
-                return digit
-        i += 1
+def calibration_sum(buffer: bytes) -> int:
+    """Sum of the numbers made of the first and last (ASCII) digit of each
+    line in the buffer."""
+    if np is None:
+        digits = buffer.translate(None, NON_DIGIT_BYTES)
+        return sum(
+            (line[0] - ZERO) * 10 + line[-1] - ZERO
+            for line in digits.split(b"\n")
+            if line
+        )
 
-    return line[d_pos[0]]
+    return _calibration_sum_numpy(buffer)
 
 
-def find_last_spelled_digit(line: str) -> str:
-    d_pos = get_digit_positions(line)
+def _calibration_sum_numpy(buffer: bytes) -> int:
+    chars = np.frombuffer(buffer, dtype=np.uint8)
+    digit_idxs = np.flatnonzero((chars >= ZERO) & (chars <= ZERO + 9))
+    if digit_idxs.size == 0:
+        return 0
+
+    # Line number of each digit, and where it changes between the digits
+    line_idxs = np.searchsorted(np.flatnonzero(chars == ord("\n")), digit_idxs)
+    line_changes = line_idxs[1:] != line_idxs[:-1]
+
+    first_digits = chars[digit_idxs[np.concatenate(([True], line_changes))]]
+    last_digits = chars[digit_idxs[np.concatenate((line_changes, [True]))]]
+
+    return int(
+        10 * (first_digits.astype(np.int64) - ZERO).sum()
+        + (last_digits.astype(np.int64) - ZERO).sum()
+    )
+
+
+class DigitAutomaton:
+    """Aho-Corasick automaton over the digit words, compiled into a DFA
+    (state -> character -> state), so scanning takes one dict lookup per
+    character and overlapping words (e.g. "twone") are all found."""
+
+    def __init__(self, words: dict[str, str]):
+        # Trie of the words
+        self.transitions: list[dict[str, int]] = [{}]
+        self.outputs: list[str | None] = [None]
 
-    if not d_pos:
-        start = 0
-    else:
-        start = d_pos[-1]
+        for word, digit in words.items():
+            state = 0
+            for c in word:
+                if c not in self.transitions[state]:
+                    self.transitions[state][c] = len(self.transitions)
+                    self.transitions.append({})
+                    self.outputs.append(None)
+                state = self.transitions[state][c]
+            self.outputs[state] = digit
 
-    i = len(line) - 1
-    while start <= i:
-        for spelled, digit in SPELLED_TO_DIGIT.items():
-            if spelled in line[i:]:
-                return digit
-        i -= 1
+        # Breadth-first, complete each state's transitions with the ones of
+        # its failure state (the longest proper suffix which is in the trie)
+        alphabet = {c for word in words for c in word}
+        failure = [0] * len(self.transitions)
+        queue = deque(self.transitions[0].values())
 
-    return line[d_pos[-1]]
+        while queue:
+            state = queue.popleft()
+            fail_transitions = self.transitions[failure[state]]
 
+            if self.outputs[state] is None:
+                self.outputs[state] = self.outputs[failure[state]]
 
-def solve_part_two(data: T_Data) -> int:
-    numbers = []
-    for line in data:
-        f_digit = find_first_spelled_digit(line)
-        l_digit = find_last_spelled_digit(line)
+            for c in alphabet:
+                child = self.transitions[state].get(c)
+                if child is None:
+                    self.transitions[state][c] = fail_transitions.get(c, 0)
+                else:
+                    failure[child] = fail_transitions.get(c, 0)
+                    queue.append(child)
 
-        numbers.append(int(f_digit + l_digit))
+    def find_first(self, chars: Iterable[str]) -> str | None:
+        """Digit of the first word (by end position) in `chars`."""
+        transitions, outputs = self.transitions, self.outputs
+        state = 0
 
-    answer = sum(numbers)
+        for c in chars:
+            state = transitions[state].get(c, 0)
+            if outputs[state] is not None:
+                return outputs[state]
+
+        return None
+
+
+DIGIT_WORDS = {**SPELLED_TO_DIGIT, **{d: d for d in "0123456789"}}
+
+# No digit word contains another one, so the first word to end is also the
+# first to start. The last word is found by scanning the line backwards.
+FORWARD_AUTOMATON = DigitAutomaton(DIGIT_WORDS)
+BACKWARD_AUTOMATON = DigitAutomaton(
+    {word[::-1]: digit for word, digit in DIGIT_WORDS.items()}
+)
+
+
+def find_first_spelled_digit(line: str) -> str:
+    digit = FORWARD_AUTOMATON.find_first(line)
+    if digit is None:
+        raise ValueError(f"No digit in line: '{line}'")
+    return digit
+
+
+def find_last_spelled_digit(line: str) -> str:
+    digit = BACKWARD_AUTOMATON.find_first(reversed(line))
+    if digit is None:
+        raise ValueError(f"No digit in line: '{line}'")
+    return digit
+
+
+def calibration_values(lines: Iterable[str]) -> Iterator[int]:
+    """Two-digit values of the lines, with spelled digits counted in."""
+    for line in lines:
+        yield int(find_first_spelled_digit(line) + find_last_spelled_digit(line))
+
+
+def solve_part_two(data: Iterable[str]) -> int:
+    answer = sum(calibration_values(data))
     return answer
 
 
@@ -87,11 +190,18 @@ def run_tests():
     part_one = solve_part_one(data)
     print("Example - part 1:", part_one)
     assert part_one == 142
+    assert solve_part_one(stream_input("data/example.txt")) == part_one
+    assert solve_part_one_file("data/example.txt") == part_one
+    assert solve_part_one_file("data/example.txt", chunk_size=7) == part_one
 
     data = parse_input("data/example2.txt")
     part_two = solve_part_two(data)
     print("Example - part 2:", part_two)
     assert part_two == 281
+    assert solve_part_two(stream_input("data/example2.txt")) == part_two
+
+    overlapping = ["twone", "eightwo3oneight", "7"]
+    assert list(calibration_values(overlapping)) == [21, 88, 77]
 
 
 def main():
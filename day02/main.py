@@ -1,88 +1,140 @@
 """Day 2"""
-from typing import NamedTuple
+import re
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
 
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-class CubesSample(NamedTuple):
+from aoc2023.inputs import read_records
+from aoc2023.numeric import np
+
+
+CUBES_RE = re.compile(r"(\d+) (red|green|blue)")
+
+
+class GameMaxima(NamedTuple):
+    ID: int
     n_red: int
     n_green: int
     n_blue: int
 
+    @classmethod
+    def from_raw(cls, line: str) -> "GameMaxima":
+        """Aggregates the line's samples on the fly (without storing them)."""
+        game_raw, samples_raw = line.split(": ")
+        maxima = {"red": 0, "green": 0, "blue": 0}
 
-class Game(NamedTuple):
-    ID: int
-    subsets: list[CubesSample]
+        for n, colour in CUBES_RE.findall(samples_raw):
+            maxima[colour] = max(maxima[colour], int(n))
 
+        return cls(
+            ID=int(game_raw.replace("Game ", "")),
+            n_red=maxima["red"],
+            n_green=maxima["green"],
+            n_blue=maxima["blue"],
+        )
 
-T_Data = list[Game]
 
+class GameStore(NamedTuple):
+    """Columnar store of the games' samples: the samples of the i-th game
+    are at `offsets[i]:offsets[i + 1]` of the colour columns."""
+    ids: array
+    offsets: array
+    n_reds: array
+    n_greens: array
+    n_blues: array
 
-def parse_input(path: str) -> T_Data:
-    data = []
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "GameStore":
+        store = cls(*(array("I") for _ in cls._fields))
+        store.offsets.append(0)
+
+        for line in lines:
+            game_raw, samples_raw = line.split(": ")
+            store.ids.append(int(game_raw.replace("Game ", "")))
+
+            for sample_raw in samples_raw.split("; "):
+                counts = {"red": 0, "green": 0, "blue": 0}
+                for n, colour in CUBES_RE.findall(sample_raw):
+                    counts[colour] = int(n)
+
+                store.n_reds.append(counts["red"])
+                store.n_greens.append(counts["green"])
+                store.n_blues.append(counts["blue"])
 
-    with open(path, "r") as fin:
-        for line in fin.readlines():
-            game_raw, subsets_raw = line.strip().split(": ")
+            store.offsets.append(len(store.n_reds))
 
-            game_id = int(game_raw.replace("Game ", ""))
+        return store
 
-            subsets = []
-            for subs in subsets_raw.split("; "):
-                n_red, n_green, n_blue = 0, 0, 0
+    def maxima(self) -> Iterator[tuple[int, int, int, int]]:
+        """(ID, n_red, n_green, n_blue) maxima of each game, as segment
+        reductions of the colour columns."""
+        columns = (self.n_reds, self.n_greens, self.n_blues)
 
-                for sub in subs.split(", "):
-                    if "red" in sub:
-                        n_red = int(sub.replace(" red", ""))
-                    if "green" in sub:
-                        n_green = int(sub.replace(" green", ""))
-                    if "blue" in sub:
-                        n_blue = int(sub.replace(" blue", ""))
+        if np is None:
+            segments = list(map(slice, self.offsets[:-1], self.offsets[1:]))
+            reduced = [
+                list(map(max, map(column.__getitem__, segments)))
+                for column in columns
+            ]
+        else:
+            starts = np.frombuffer(self.offsets, dtype=self.offsets.typecode)[:-1]
+            reduced = [
+                np.maximum.reduceat(
+                    np.frombuffer(column, dtype=column.typecode),
+                    starts,
+                ).tolist()
+                for column in columns
+            ]
 
-                subsets.append(
-                    CubesSample(
-                        n_red=n_red,
-                        n_green=n_green,
-                        n_blue=n_blue,
-                    )
-                )
+        return zip(self.ids, *reduced)
 
-            data.append(Game(ID=game_id, subsets=subsets))
 
+T_Data = GameStore
+
+
+def stream_input(path: str) -> Iterator[GameMaxima]:
+    return map(GameMaxima.from_raw, read_records(path))
+
+
+def parse_input(path: str) -> T_Data:
+    return GameStore.from_lines(read_records(path))
+
+
+def game_maxima(
+    data: GameStore | Iterable[GameMaxima],
+) -> Iterable[tuple[int, int, int, int]]:
+    if isinstance(data, GameStore):
+        return data.maxima()
     return data
 
 
-def solve_part_one(data: T_Data) -> int:
+def solve_part_one(data: GameStore | Iterable[GameMaxima]) -> int:
     max_n_red = 12
     max_n_green = 13
     max_n_blue = 14
 
     answer = 0
 
-    for game in data:
-        if all(
-            sample.n_red <= max_n_red
-            and sample.n_green <= max_n_green
-            and sample.n_blue <= max_n_blue
-            for sample in game.subsets
+    for game_id, n_red, n_green, n_blue in game_maxima(data):
+        if (
+            n_red <= max_n_red
+            and n_green <= max_n_green
+            and n_blue <= max_n_blue
         ):
-            answer += game.ID
+            answer += game_id
 
     return answer
 
 
-def solve_part_two(data: T_Data) -> int:
+def solve_part_two(data: GameStore | Iterable[GameMaxima]) -> int:
     answer = 0
 
-    for game in data:
-        min_n_red = 0
-        min_n_green = 0
-        min_n_blue = 0
-
-        for sample in game.subsets:
-            min_n_red = max(sample.n_red, min_n_red)
-            min_n_green = max(sample.n_green, min_n_green)
-            min_n_blue = max(sample.n_blue, min_n_blue)
-
-        answer += min_n_red * min_n_green * min_n_blue
+    for _, n_red, n_green, n_blue in game_maxima(data):
+        answer += n_red * n_green * n_blue
 
     return answer
 
@@ -98,6 +150,9 @@ def run_tests():
     print("Example - part 2:", part_two)
     assert part_two == 2_286
 
+    assert solve_part_one(stream_input("data/example.txt")) == part_one
+    assert solve_part_two(stream_input("data/example.txt")) == part_two
+
 
 def main():
     run_tests()
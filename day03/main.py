@@ -1,5 +1,18 @@
 """Day 3"""
-from typing import NamedTuple
+import re
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.grid import Grid
+
+
+SYMBOL_RE = re.compile(rb"[^\d.]")
+NO_PART = -1
 
 
 class Position(NamedTuple):
@@ -12,94 +25,83 @@ class Position(NamedTuple):
 
 class PartNumber(NamedTuple):
     number: int
-    positions: list[Position]
-
-    def is_adjacent_to_symbol(self, symbols: dict[Position, str]) -> bool:
-        for pos in self.positions:
-            for neighbor_pos in self._get_neighbor_positions(pos):
-                if neighbor_pos in symbols.keys():
-                    return True
-        return False
-
-    def _get_neighbor_positions(self, position: Position) -> list[Position]:
-        x, y = position
-        offsets = (-1, 0, 1)
-        return [
-            Position(x + off_x, y + off_y)
-            for off_x in offsets
-            for off_y in offsets
-            if not (off_x == 0 and off_y == 0)
-        ]
+    position: Position  # Of the first digit
+    length: int
 
 
 class InputData(NamedTuple):
-    symbols: dict[Position, str]
+    schematic: Grid
     part_numbers: list[PartNumber]
+    part_ids: array  # Index of the part number at each cell (row-major)
 
 
 def parse_input(path: str) -> InputData:
-    symbols = {}
+    schematic = Grid.map_file(path)
     part_numbers = []
+    part_ids = array("i", [NO_PART]) * (schematic.height * schematic.width)
 
-    with open(path, "r") as fin:
-        for x, line in enumerate(fin.readlines()):
-            current_number = 0
-            current_number_positions = []
-
-            for y, char in enumerate(line.strip()):
-                if char.isnumeric():
-                    current_number = current_number * 10 + int(char)
-                    current_number_positions.append(Position(x, y))
-                else:
-                    if current_number > 0:
-                        part_numbers.append(
-                            PartNumber(
-                                number=current_number, 
-                                positions=current_number_positions,
-                            )
-                        )
-                        current_number = 0
-                        current_number_positions = []
-                    if char != ".": # is a symbol
-                        symbols[Position(x, y)] = char
-
-            if current_number > 0:
-                part_numbers.append(
-                    PartNumber(
-                        number=current_number, 
-                        positions=current_number_positions,
-                    )
+    for x, row in enumerate(schematic.rows()):
+        for match in re.finditer(rb"\d+", bytes(row)):
+            begin, end = match.span()
+
+            for y in range(begin, end):
+                part_ids[x * schematic.width + y] = len(part_numbers)
+
+            part_numbers.append(
+                PartNumber(
+                    number=int(match.group()),
+                    position=Position(x, begin),
+                    length=end - begin,
                 )
+            )
+
+    return InputData(
+        schematic=schematic,
+        part_numbers=part_numbers,
+        part_ids=part_ids,
+    )
 
-        return InputData(
-            symbols=symbols,
-            part_numbers=part_numbers,
-        )
+
+def find_symbols(schematic: Grid, symbol_re: re.Pattern) -> Iterator[Position]:
+    for x, row in enumerate(schematic.rows()):
+        for match in symbol_re.finditer(bytes(row)):
+            yield Position(x, match.start())
+
+
+def get_adjacent_part_ids(data: InputData, position: Position) -> set[int]:
+    width = data.schematic.width
+
+    part_ids = {
+        data.part_ids[x * width + y]
+        for x, y in data.schematic.neighbours(*position, diagonal=True)
+    }
+    part_ids.discard(NO_PART)
+
+    return part_ids
 
 
 def solve_part_one(data: InputData) -> int:
-    answer = 0
+    adjacent_part_ids = set()
 
-    for part_number in data.part_numbers:
-        if part_number.is_adjacent_to_symbol(data.symbols):
-            answer += part_number.number
+    for symbol_pos in find_symbols(data.schematic, SYMBOL_RE):
+        adjacent_part_ids |= get_adjacent_part_ids(data, symbol_pos)
 
+    answer = sum(data.part_numbers[idx].number for idx in adjacent_part_ids)
     return answer
 
 
 def solve_part_two(data: InputData) -> int:
     answer = 0
 
-    gear_positions = [k for k, v in data.symbols.items() if v == "*"]
+    for gear_pos in find_symbols(data.schematic, re.compile(rb"\*")):
+        part_ids = get_adjacent_part_ids(data, gear_pos)
 
-    for gear_pos in gear_positions:
-        part_numbers = [
-            pn.number
-            for pn in data.part_numbers
-            if pn.is_adjacent_to_symbol({gear_pos: "*"})
-        ]
-        if len(part_numbers) == 2:
-            answer += part_numbers[0] * part_numbers[1]
+        if len(part_ids) == 2:
+            first, second = part_ids
+            answer += (
+                data.part_numbers[first].number
+                * data.part_numbers[second].number
+            )
 
     return answer
 
@@ -1,11 +1,19 @@
 """Day 4"""
-from typing import NamedTuple
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.inputs import read_records
 
 
 class Card(NamedTuple):
     ID: int
-    winning_numbers: list[int]
-    card_numbers: list[int]
+    winning_mask: int  # Bit `n` is set if number `n` is on the card
+    card_mask: int
 
 
     @classmethod
@@ -14,63 +22,65 @@ class Card(NamedTuple):
 
         card_id = int(card_info.replace("Card ", ""))
 
-        winning_raw, card_raw = numbers.strip().replace("  ", " ").split(" | ")
-        winning_numbers = [int(n) for n in winning_raw.split(" ")]
-        card_numbers = [int(n) for n in card_raw.split(" ")]
+        winning_raw, card_raw = numbers.split(" | ")
 
         return cls(
             ID=card_id,
-            winning_numbers=winning_numbers,
-            card_numbers=card_numbers,
+            winning_mask=to_mask(winning_raw),
+            card_mask=to_mask(card_raw),
         )
 
     def n_matching_nums(self) -> int:
-        intersecting_nums = (
-            set(self.winning_numbers)
-            .intersection(set(self.card_numbers))
-        )
+        return (self.winning_mask & self.card_mask).bit_count()
 
-        return len(intersecting_nums)
+
+def to_mask(numbers_raw: str) -> int:
+    mask = 0
+    for n in numbers_raw.split():
+        mask |= 1 << int(n)
+    return mask
 
 
 InputData = list[Card]
 
 
+def stream_input(path: str) -> Iterator[Card]:
+    return map(Card.from_raw_str, read_records(path))
+
+
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        return [
-            Card.from_raw_str(line.strip())
-            for line in fin.readlines()
-        ]
+    return list(stream_input(path))
 
 
-def solve_part_one(data: InputData) -> int:
+def solve_part_one(data: Iterable[Card]) -> int:
     answer = 0
 
     for card in data:
         n_matching_nums = card.n_matching_nums()
 
         if n_matching_nums > 0:
-            points = 2 ** (n_matching_nums - 1)
-        else:
-            points = 0
-
-        answer += points
+            answer += 1 << (n_matching_nums - 1)
 
     return answer
 
 
-def solve_part_two(data: InputData) -> int:
-    copies = [1] * len(data)
+def solve_part_two(data: Iterable[Card]) -> int:
+    answer = 0
 
-    for card in data:
-        card_id = card.ID
-        n_matching_nums = card.n_matching_nums()
+    # Copies of the current card won from the previous cards, and (as a
+    # difference array) how that number changes at the following cards
+    n_won = 0
+    n_won_changes = defaultdict(int)
 
-        for off in range(n_matching_nums):
-            copies[card_id + off] += copies[card_id - 1]
+    for idx, card in enumerate(data):
+        n_won += n_won_changes.pop(idx, 0)
+        n_copies = 1 + n_won
+        answer += n_copies
 
-    answer = sum(copies)
+        n_matching_nums = card.n_matching_nums()
+        if n_matching_nums > 0:
+            n_won_changes[idx + 1] += n_copies
+            n_won_changes[idx + 1 + n_matching_nums] -= n_copies
 
     return answer
 
@@ -81,10 +91,12 @@ def run_tests():
     part_one = solve_part_one(data)
     print("Example - part 1:", part_one)
     assert part_one == 13
+    assert solve_part_one(stream_input("data/example.txt")) == part_one
 
     part_two = solve_part_two(data)
     print("Example - part 2:", part_two)
     assert part_two == 30
+    assert solve_part_two(stream_input("data/example.txt")) == part_two
 
 
 def main():
@@ -1,5 +1,14 @@
 """Day 5"""
-from typing import NamedTuple
+import sys
+from bisect import bisect_right
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple, Sequence
+
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.inputs import read_records
+from aoc2023.numeric import np
 
 
 class Range(NamedTuple):
@@ -10,12 +19,6 @@ class Range(NamedTuple):
     def end(self) -> int:
         return self.begin + self.length - 1
 
-    def contains(self, value: int) -> bool:
-        return self.begin <= value <= self.end
-
-    def contains_range(self, other: "Range") -> bool:
-        return self.begin <= other.begin and other.end <= self.end
-
     def __repr__(self) -> str:
         return f"[{self.begin:_}...{self.end:_}]"
 
@@ -34,121 +37,218 @@ class Map(NamedTuple):
         _mappings = sorted(_mappings, key=lambda rs: rs[0].begin)
         return cls(_mappings)
 
-    def convert(self, value: int) -> int:
-        for src_range, dst_range in self.mappings:
-            if src_range.contains(value):
-                return dst_range.begin - src_range.begin + value
-
-        return value
-
-    def convert_range(self, r: Range) -> list[Range]:
-        for src_range, dst_range in self.mappings:
-            diff = dst_range.begin - src_range.begin
-
-            if src_range.contains_range(r):
-                out = Range(
-                    begin=r.begin + diff,
-                    length=r.length,
-                )
-                return [out]
-
-            elif src_range.begin <= r.begin <= src_range.end:
-                r1 = Range(
-                    begin=r.begin + diff,
-                    length=src_range.length - (r.begin - src_range.begin),
-                )
-                r2 = Range(
-                    begin=src_range.end + 1,
-                    length=r.end - src_range.end,
-                )
-                assert r1.length + r2.length == r.length
-
-                return [r1, *self.convert_range(r2)]
-
-            elif src_range.begin <= r.end <= src_range.end:
-                r1 = Range(
-                    begin=r.begin,
-                    length=src_range.begin - r.begin,
-                )
-                r2 = Range(
-                    begin=src_range.begin,
-                    length=r.end - src_range.begin + 1,
-                )
-                assert r1.length + r2.length == r.length
-
-                return [*self.convert_range(r1), r2]
-
-        return [r]
+
+class PiecewiseMap(NamedTuple):
+    """Function mapping `value` to `value + offsets[i]`, where `i` is the
+    piece with `starts[i] <= value < starts[i + 1]`.
+
+    The pieces are sorted and cover all non-negative values (`starts[0] == 0`,
+    the last piece is unbounded).
+    """
+    starts: list[int]
+    offsets: list[int]
+
+    @classmethod
+    def identity(cls) -> "PiecewiseMap":
+        return cls([0], [0])
+
+    @classmethod
+    def from_pieces(cls, pieces: Iterable[tuple[int, int]]) -> "PiecewiseMap":
+        """Map from sorted (start, offset) pairs, merging adjacent pieces
+        with the same offset."""
+        starts, offsets = [], []
+
+        for start, offset in pieces:
+            if starts and starts[-1] == start:
+                starts.pop()
+                offsets.pop()
+
+            if not offsets or offsets[-1] != offset:
+                starts.append(start)
+                offsets.append(offset)
+
+        return cls(starts, offsets)
+
+    @classmethod
+    def from_map(cls, _map: Map) -> "PiecewiseMap":
+        pieces = [(0, 0)]
+
+        for src_range, dst_range in _map.mappings:
+            pieces.append((src_range.begin, dst_range.begin - src_range.begin))
+            pieces.append((src_range.end + 1, 0))
+
+        return cls.from_pieces(pieces)
+
+    def __call__(self, value: int) -> int:
+        return value + self.offsets[bisect_right(self.starts, value) - 1]
+
+    def then(self, other: "PiecewiseMap") -> "PiecewiseMap":
+        """Composition applying this map first and `other` to its output."""
+        pieces = []
+        n_pieces = len(self.starts)
+
+        for idx, (start, offset) in enumerate(zip(self.starts, self.offsets)):
+            end = self.starts[idx + 1] if idx + 1 < n_pieces else None
+
+            # Splits the piece at the breakpoints of `other` within its image
+            other_idx = bisect_right(other.starts, start + offset) - 1
+            pos = start
+
+            while True:
+                pieces.append((pos, offset + other.offsets[other_idx]))
+
+                other_idx += 1
+                if other_idx == len(other.starts):
+                    break
+
+                pos = other.starts[other_idx] - offset
+                if end is not None and pos >= end:
+                    break
+
+        return PiecewiseMap.from_pieces(pieces)
+
+    def evaluate(self, values: Sequence[int]) -> Sequence[int]:
+        """Maps many values at once (vectorized if NumPy is available)."""
+        if np is None:
+            starts, offsets = self.starts, self.offsets
+            return [v + offsets[bisect_right(starts, v) - 1] for v in values]
+
+        values = np.asarray(values, dtype=np.int64)
+        idxs = np.searchsorted(self.starts, values, side="right") - 1
+        return values + np.asarray(self.offsets, dtype=np.int64)[idxs]
+
+
+class IntervalSet(NamedTuple):
+    """Sorted, disjoint and non-adjacent half-open intervals [begin, end)."""
+    intervals: list[tuple[int, int]]
+
+    @classmethod
+    def coalesce(cls, intervals: Iterable[tuple[int, int]]) -> "IntervalSet":
+        """Set of the values in any of the intervals, merging the overlapping
+        and adjacent ones."""
+        out = []
+
+        for begin, end in sorted(intervals):
+            if begin >= end:
+                continue
+
+            if out and begin <= out[-1][1]:
+                if end > out[-1][1]:
+                    out[-1] = (out[-1][0], end)
+            else:
+                out.append((begin, end))
+
+        return cls(out)
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[Range]) -> "IntervalSet":
+        return cls.coalesce((r.begin, r.begin + r.length) for r in ranges)
+
+    def split(self, breakpoints: Sequence[int]) -> Iterator[tuple[int, int, int]]:
+        """Splits the intervals at the sorted breakpoints, yielding
+        (begin, end, idx) with `breakpoints[idx] <= begin` (`idx` is -1 before
+        the first breakpoint)."""
+        idx = -1
+
+        for begin, end in self.intervals:
+            idx = bisect_right(breakpoints, begin, lo=idx + 1) - 1
+
+            while begin < end:
+                if idx + 1 < len(breakpoints) and breakpoints[idx + 1] < end:
+                    yield begin, breakpoints[idx + 1], idx
+                    begin = breakpoints[idx + 1]
+                    idx += 1
+                else:
+                    yield begin, end, idx
+                    begin = end
+
+    def translate(self, fn: PiecewiseMap) -> "IntervalSet":
+        """Image of the set by `fn`: each split part is shifted by the offset
+        of its piece, then the results are coalesced, so the intervals grow
+        by at most one per breakpoint of `fn`."""
+        offsets = fn.offsets
+        return IntervalSet.coalesce(
+            (begin + offsets[idx], end + offsets[idx])
+            for begin, end, idx in self.split(fn.starts)
+        )
+
+    def min(self) -> int:
+        return self.intervals[0][0]
+
+
+def chain_maps(
+    maps: dict[tuple[str, str], Map],
+    src: str = "seed",
+    dst: str = "location",
+) -> list[PiecewiseMap]:
+    """Maps of the stages from `src` to `dst`, in order."""
+    by_src = {s: (d, _map) for (s, d), _map in maps.items()}
+    stages = []
+
+    while src != dst:
+        src, _map = by_src[src]
+        stages.append(PiecewiseMap.from_map(_map))
+
+    return stages
+
+
+def compose_maps(stages: Iterable[PiecewiseMap]) -> PiecewiseMap:
+    composed = PiecewiseMap.identity()
+
+    for stage in stages:
+        composed = composed.then(stage)
+
+    return composed
 
 
 class InputData(NamedTuple):
     seeds: list[int]
     maps: dict[tuple[str, str], Map]
+    stages: list[PiecewiseMap]
+    seed_to_location: PiecewiseMap
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        seeds = [
-            int(seed)
-            for seed in fin.readline().strip().replace("seeds: ", "").split(" ")
-        ]
-        fin.readline()
+    blocks = read_records(path, separator="\n\n")
 
-        maps = {}
-        for block in fin.read().split("\n\n"):
-            name_raw, *mappings_raw = block.strip().split("\n")
-            src, dst = name_raw.replace(" map:", "").split("-to-")
-            _map = Map.from_raw(mappings_raw)
+    seeds = [
+        int(seed)
+        for seed in next(blocks).replace("seeds: ", "").split(" ")
+    ]
 
-            maps[(src, dst)] = _map
+    maps = {}
+    for block in blocks:
+        name_raw, *mappings_raw = block.split("\n")
+        src, dst = name_raw.replace(" map:", "").split("-to-")
+        _map = Map.from_raw(mappings_raw)
 
-        return InputData(seeds=seeds, maps=maps)
+        maps[(src, dst)] = _map
 
+    stages = chain_maps(maps)
 
-def solve_part_one(data: InputData) -> int:
-    locations = []
-    for seed in data.seeds:
-        location = find_closest_location(seed, maps=data.maps)
-        locations.append(location)
-
-    return min(locations)
+    return InputData(
+        seeds=seeds,
+        maps=maps,
+        stages=stages,
+        seed_to_location=compose_maps(stages),
+    )
 
 
-def find_closest_location(seed: int, maps: dict[tuple[str, str], Map]) -> int:
-    soil = maps[("seed", "soil")].convert(value=seed)
-    fertilizer = maps[("soil", "fertilizer")].convert(value=soil)
-    water = maps[("fertilizer", "water")].convert(value=fertilizer)
-    light = maps[("water", "light")].convert(value=water)
-    temperature = maps[("light", "temperature")].convert(value=light)
-    humidity = maps[("temperature", "humidity")].convert(value=temperature)
-    location = maps[("humidity", "location")].convert(value=humidity)
-
-    return location
+def solve_part_one(data: InputData) -> int:
+    return int(min(data.seed_to_location.evaluate(data.seeds)))
 
 
 def solve_part_two(data: InputData) -> int:
-    def _convert_all(input_ranges, key) -> list[Range]:
-        return [
-            r
-            for ir in input_ranges
-            for r in data.maps[key].convert_range(ir)
-        ]
-
-
     seed_ranges = []
     for i in range(0, len(data.seeds) - 1, 2):
         src, length = data.seeds[i], data.seeds[i + 1]
         seed_ranges.append(Range(src, length))
 
-    soil_ranges = _convert_all(seed_ranges, ("seed", "soil"))
-    fertilizer_ranges = _convert_all(soil_ranges, ("soil", "fertilizer"))
-    water_ranges = _convert_all(fertilizer_ranges, ("fertilizer", "water"))
-    light_ranges = _convert_all(water_ranges, ("water", "light"))
-    temp_ranges = _convert_all(light_ranges, ("light", "temperature"))
-    humidity_ranges = _convert_all(temp_ranges, ("temperature", "humidity"))
-    location_ranges = _convert_all(humidity_ranges, ("humidity", "location"))
+    ranges = IntervalSet.from_ranges(seed_ranges)
+    for stage in data.stages:
+        ranges = ranges.translate(stage)
 
-    answer = min(lr.begin for lr in location_ranges)
+    answer = ranges.min()
 
     return answer
 
@@ -164,6 +264,18 @@ def run_tests():
     print("Example - part 2:", part_two)
     assert part_two == 46
 
+    seed_to_location = data.seed_to_location
+    assert [seed_to_location(seed) for seed in (79, 14, 55, 13)] == [82, 43, 86, 35]
+    assert list(seed_to_location.evaluate([79, 14, 55, 13])) == [82, 43, 86, 35]
+
+    seed_ranges = IntervalSet.from_ranges([Range(79, 14), Range(55, 13), Range(60, 30)])
+    assert seed_ranges.intervals == [(55, 93)]
+    location_ranges = seed_ranges.translate(seed_to_location)
+    assert location_ranges.intervals == [(0, 1), (46, 61), (73, 85), (86, 90), (94, 100)]
+    for stage in data.stages:
+        seed_ranges = seed_ranges.translate(stage)
+    assert seed_ranges == location_ranges
+
 
 def main():
     run_tests()
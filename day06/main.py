@@ -1,6 +1,15 @@
 """Day 6"""
+import math
 import re
-from typing import NamedTuple
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.inputs import read_records
+from aoc2023.numeric import np
 
 
 class RaceStats(NamedTuple):
@@ -11,47 +20,82 @@ class RaceStats(NamedTuple):
 InputData = list[RaceStats]
 
 
+def stream_input(path: str) -> Iterator[RaceStats]:
+    times_raw, distances_raw = read_records(path)
+
+    for time, distance in zip(
+        re.finditer("\d+", times_raw),
+        re.finditer("\d+", distances_raw),
+    ):
+        yield RaceStats(
+            duration_ms=int(time.group()),
+            best_distance_mm=int(distance.group()),
+        )
+
+
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        times = [int(t) for t in re.findall("\d+", fin.readline())]
-        distances = [int(d) for d in re.findall("\d+", fin.readline())]
+    return list(stream_input(path))
 
-        return [
-            RaceStats(duration_ms=time, best_distance_mm=distance)
-            for time, distance in zip(times, distances)
-        ]
 
+def solve_part_one(data: Iterable[RaceStats]) -> int:
+    return math.prod(count_ways_to_win_batch(list(data)))
 
-def solve_part_one(data: InputData) -> int:
-    answer = 1
 
-    for race_stats in data:
-        num_ways_win = 0
-        for button_pressed_ms in range(1, race_stats.duration_ms + 1):
-            distance_travelled_mm = (
-                button_pressed_ms
-                * (race_stats.duration_ms - button_pressed_ms)
-            )
+def count_ways_to_win(race_stats: RaceStats) -> int:
+    """Number of button press times `p` with `p * (duration - p) > best`.
+
+    These are the integers strictly between the roots of
+    `p^2 - duration * p + best`, symmetric around `duration / 2`.
+    """
+    duration, best = race_stats
+
+    discriminant = duration * duration - 4 * best
+    if discriminant < 0:
+        return 0
+
+    # Lowest winning press time, corrected for the rounding of the root
+    lo = (duration - math.isqrt(discriminant)) // 2
+    while lo * (duration - lo) <= best and lo <= duration:
+        lo += 1
+    while lo > 0 and (lo - 1) * (duration - lo + 1) > best:
+        lo -= 1
 
-            if distance_travelled_mm > race_stats.best_distance_mm:
-                num_ways_win += 1
+    return max(duration - 2 * lo + 1, 0)
 
-        answer *= num_ways_win
 
-    return answer
+def count_ways_to_win_batch(races: list[RaceStats]) -> list[int]:
+    """`count_ways_to_win` for many races (vectorized if NumPy is available)."""
+    # Squared durations must fit into int64
+    if np is None or not races or max(duration for duration, _ in races) >= 2**31:
+        return list(map(count_ways_to_win, races))
 
+    return _count_ways_to_win_numpy(races).tolist()
 
-def solve_part_two(data: InputData) -> int:
+
+def _count_ways_to_win_numpy(races: list[RaceStats]):
+    duration, best = np.array(races, dtype=np.int64).T
+
+    discriminant = duration * duration - 4 * best
+    root = np.floor(np.sqrt(np.maximum(discriminant, 0))).astype(np.int64)
+
+    # The float root is at most 1 off, and so is the lowest winning press time
+    lo = (duration - root) // 2
+    for _ in range(2):
+        lo += lo * (duration - lo) <= best
+    lo -= (lo - 1) * (duration - lo + 1) > best
+
+    return np.where(discriminant < 0, 0, np.maximum(duration - 2 * lo + 1, 0))
+
+
+def solve_part_two(data: Iterable[RaceStats]) -> int:
     time, distance = "", ""
     for race_stats in data:
         time += str(race_stats.duration_ms)
         distance += str(race_stats.best_distance_mm)
 
-    answer = solve_part_one([
+    return count_ways_to_win(
         RaceStats(duration_ms=int(time), best_distance_mm=int(distance))
-    ])
-
-    return answer
+    )
 
 
 def run_tests():
@@ -65,6 +109,13 @@ def run_tests():
     print("Example - part 2:", part_two)
     assert part_two == 71_503
 
+    assert solve_part_one(stream_input("data/example.txt")) == part_one
+    assert solve_part_two(stream_input("data/example.txt")) == part_two
+
+    assert count_ways_to_win(RaceStats(4, 4)) == 0  # Ties don't win
+    assert count_ways_to_win(RaceStats(5, 5)) == 2
+    assert count_ways_to_win_batch(data) == [4, 8, 9]
+
 
 def main():
     run_tests()
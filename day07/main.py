@@ -1,12 +1,31 @@
 """Day 7"""
-from collections import Counter
+import sys
 from enum import Enum
-from typing import NamedTuple
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.inputs import read_records
+from aoc2023.numeric import np
+
+
+CARD_RANKS = str.maketrans("23456789TJQKA", "0123456789abc")
+JOKER_CARD_RANKS = str.maketrans("J23456789TQKA", "0123456789abc")
 
 
 class Hand(NamedTuple):
-    cards: list[str]
+    cards: str
     bid: int
+    key: int
+    joker_key: int
+
+    @classmethod
+    def from_raw(cls, raw: str) -> "Hand":
+        cards, bid = raw.split(" ")
+        key, joker_key = hand_keys(cards)
+        return cls(cards=cards, bid=int(bid), key=key, joker_key=joker_key)
 
 
 class HandType(Enum):
@@ -18,25 +37,20 @@ class HandType(Enum):
     ONE_PAIR = 2
     HIGH_CARD = 1
 
+    @classmethod
+    def classify(cls, cards: str) -> tuple[int, int]:
+        """Types of the hand without and with jokers, looked up by the sum of
+        the counts of its cards (i.e. of its squared card counts, unique for
+        each type) and by its number of jokers."""
+        return HAND_TYPES[(sum(map(cards.count, cards)), cards.count("J"))]
+
     @classmethod
     def get_type(cls, cards: str) -> int:
-        counts = [c for _, c in Counter(cards).most_common()]
-        return cls._counts_to_type(counts=counts)
+        return cls.classify(cards)[0]
 
     @classmethod
     def get_type_with_joker(cls, cards: str) -> int:
-        num_jokers = cards.count("J")
-        counts = [
-            cnt 
-            for _, cnt in Counter([c for c in cards if c != "J"]).most_common()
-        ]
-
-        if not counts:
-            counts = [5]  # All jokers
-        else:
-            counts[0] += num_jokers
-
-        return cls._counts_to_type(counts=counts)
+        return cls.classify(cards)[1]
 
     @classmethod
     def _counts_to_type(cls, counts: list[int]) -> int:
@@ -56,59 +70,82 @@ class HandType(Enum):
             return cls.HIGH_CARD.value
 
 
+def _partitions(n: int, max_part: int | None = None) -> Iterator[list[int]]:
+    """Partitions of `n` with their parts in decreasing order."""
+    if n == 0:
+        yield []
+        return
+
+    for part in range(min(n, max_part or n), 0, -1):
+        for rest in _partitions(n - part, part):
+            yield [part, *rest]
+
+
+def _build_hand_types() -> dict[tuple[int, int], tuple[int, int]]:
+    hand_types = {}
+
+    for counts in _partitions(5):
+        plain_type = HandType._counts_to_type(counts)
+
+        for num_jokers in {0, *counts}:
+            others = counts.copy()
+            if num_jokers:
+                others.remove(num_jokers)
+
+            joker_counts = [others[0] + num_jokers, *others[1:]] if others else [5]
+            joker_type = HandType._counts_to_type(joker_counts)
+
+            key = (sum(count * count for count in counts), num_jokers)
+            hand_types[key] = (plain_type, joker_type)
+
+    return hand_types
+
+
+# (sum of the squared card counts, number of jokers) -> (type, type with jokers)
+HAND_TYPES = _build_hand_types()
+
+
+def hand_keys(cards: str) -> tuple[int, int]:
+    """Sort keys of the hand without and with jokers, packing the type in the
+    high bits above 4 bits per card rank (as hex digits)."""
+    hand_type, joker_type = HandType.classify(cards)
+
+    return (
+        hand_type << 20 | int(cards.translate(CARD_RANKS), 16),
+        joker_type << 20 | int(cards.translate(JOKER_CARD_RANKS), 16),
+    )
+
+
 InputData = list[Hand]
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        data = []
-        for line in fin.readlines():
-            cards, bid = line.strip().split(" ")
-            data.append(Hand(cards=list(cards), bid=int(bid)))
-
-        return data
+    return [Hand.from_raw(line) for line in read_records(path)]
 
 
 def solve_part_one(data: InputData) -> int:
     return compute_answer(
-        data=data,
-        type_fn=HandType.get_type,
-        card_priorities=[
-            "2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A",
-        ],
+        keys=[hand.key for hand in data],
+        bids=[hand.bid for hand in data],
     )
 
 
 def solve_part_two(data: InputData) -> int:
     return compute_answer(
-        data=data,
-        type_fn=HandType.get_type_with_joker,
-        card_priorities=[
-            "J", "2", "3", "4", "5", "6", "7", "8", "9", "T", "Q", "K", "A",
-        ],
-    )
-
-
-def compute_answer(
-    data: InputData,
-    type_fn,
-    card_priorities: list[str],
-) -> int:
-    answer = 0
-
-    sorted_hands = sorted(
-        data,
-        key=lambda hand: (
-            type_fn(hand.cards),
-            *[card_priorities.index(card) for card in hand.cards],
-        ),
+        keys=[hand.joker_key for hand in data],
+        bids=[hand.bid for hand in data],
     )
 
 
-    for rank, hand in zip(range(1, len(data) + 1), sorted_hands):
-        answer += rank * hand.bid
+def compute_answer(keys: list[int], bids: list[int]) -> int:
+    """Total winnings of the hands ranked by their keys (ties keep their order)."""
+    if np is None:
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        return sum(rank * bids[idx] for rank, idx in enumerate(order, start=1))
 
-    return answer
+    order = np.argsort(np.asarray(keys, dtype=np.int64), kind="stable")
+    ranks = np.arange(1, len(keys) + 1, dtype=np.int64)
+    return int(np.asarray(bids, dtype=np.int64)[order] @ ranks)
 
 
 def run_tests():
@@ -125,6 +162,14 @@ def run_tests():
     assert HandType.get_type_with_joker("T55J5") == 6  # FOUR OF A KIND
     assert HandType.get_type_with_joker("KTJJT") == 6  # FOUR OF A KIND
     assert HandType.get_type_with_joker("QQQJA") == 6  # FOUR OF A KIND
+    assert HandType.get_type_with_joker("JJJJJ") == 7  # FIVE OF A KIND
+    assert HandType.get_type_with_joker("JJ2J3") == 6  # FOUR OF A KIND
+
+    assert HandType.classify("KTJJT") == (3, 6)
+    assert len(HAND_TYPES) == 19
+
+    assert hand_keys("KTJJT") == (0x3_b8998, 0x6_b9009)
+    assert hand_keys("T55J5") < hand_keys("QQQJA")
 
     data = parse_input("data/example.txt")
 
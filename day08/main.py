@@ -1,77 +1,354 @@
 """Day 8"""
 import math
+import os
 import re
-from itertools import cycle
-from typing import NamedTuple
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Generator, NamedTuple
 
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-class Node(NamedTuple):
-    name: str
-    left_node: str
-    right_node: str
+from aoc2023.inputs import read_records
+from aoc2023.numeric import np
 
 
 class InputData(NamedTuple):
     instructions: list[str]
-    nodes: dict[str, Node]
+    names: list[str]
+    node_ids: dict[str, int]
+    left: array  # Node ids
+    right: array
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        instructions = list(fin.readline().strip())
+    records = read_records(path)
 
-        fin.readline()
+    instructions = list(next(records))
 
-        nodes = {}
-        for line in fin.readlines():
-            parsed = re.search(
-                pattern=(
-                    "(?P<source>[A-Z1-9]{3}) = \("
-                    "(?P<left>[A-Z1-9]{3}), "
-                    "(?P<right>[A-Z1-9]{3})\)\n"
-                ),
-                string=line,
-            )
+    next(records)
 
-            source = parsed.group("source")
-            left = parsed.group("left")
-            right = parsed.group("right")
+    raw_nodes = []
+    for line in records:
+        parsed = re.search(
+            pattern=(
+                "(?P<source>[A-Z1-9]{3}) = \("
+                "(?P<left>[A-Z1-9]{3}), "
+                "(?P<right>[A-Z1-9]{3})\)"
+            ),
+            string=line,
+        )
 
-            nodes[source] = Node(name=source, left_node=left, right_node=right)
+        raw_nodes.append(parsed.group("source", "left", "right"))
 
-        return InputData(instructions=instructions, nodes=nodes)
+    return build_input(instructions, raw_nodes)
 
 
-def solve_part_one(data: InputData) -> int:
-    return get_path_length(data=data, node="AAA", stop_node="ZZZ")
+def build_input(
+    instructions: list[str],
+    raw_nodes: list[tuple[str, str, str]],  # (name, left, right)
+) -> InputData:
+    names = [source for source, _, _ in raw_nodes]
+    node_ids = {name: node_id for node_id, name in enumerate(names)}
+
+    return InputData(
+        instructions=instructions,
+        names=names,
+        node_ids=node_ids,
+        left=array("I", (node_ids[left] for _, left, _ in raw_nodes)),
+        right=array("I", (node_ids[right] for _, _, right in raw_nodes)),
+    )
+
+
+def stop_mask(data: InputData, suffix: str) -> bytearray:
+    return bytearray(name.endswith(suffix) for name in data.names)
+
+
+def first_stop(data: InputData, is_stop: bytearray, node: int) -> int:
+    """Number of steps from the node to the first stop node."""
+    left, right = data.left, data.right
+    start, n_steps = node, 0
 
+    for _ in range(len(data.names)):
+        for instruction in data.instructions:
+            if is_stop[node]:
+                return n_steps
+            node = left[node] if instruction == "L" else right[node]
+            n_steps += 1
 
-def get_path_length(data: InputData, node: str, stop_node: str) -> int:
-    path_length = 0
+    # A walk meeting a stop does so within #nodes passes (after that, the
+    # nodes at the starts of the passes repeat)
+    raise ValueError(f"No stop node can be reached from node {start}")
 
-    current_node = node
 
-    for instruction in cycle(data.instructions):
-        if current_node.endswith(stop_node):
-            break
+class GhostCycle(NamedTuple):
+    """Steps at which a walk meets stop nodes: every step in `pre_stops`,
+    and `stop + k * period` for each of the `cycle_stops` and any k >= 0."""
+    cycle_start: int  # Step from which the walk repeats
+    period: int
+    pre_stops: list[int]  # Stops before `cycle_start`
+    cycle_stops: list[int]  # Stops in [cycle_start, cycle_start + period)
 
-        if instruction == "L":
-            current_node = data.nodes[current_node].left_node
-        else:
-            current_node = data.nodes[current_node].right_node
 
-        path_length += 1
+# Each step of the index vector costs a few NumPy calls, which only pays off
+# against walking the nodes one by one from about 50 walks
+NUMPY_MIN_WALKS = 64
 
-    return path_length
 
+def walk_passes(
+    data: InputData,
+    is_stop: bytearray,
+    nodes: list[int],
+) -> tuple[list[int], list[list[int]]]:
+    """Nodes at the end of one pass from each of the nodes, and the steps of
+    all the stops within the pass.
 
-def solve_part_two(data: InputData) -> int:
-    start_nodes = [node for node in data.nodes.keys() if node.endswith("A")]
-    path_lengths = [
-        get_path_length(data=data, node=node, stop_node="Z")
-        for node in start_nodes
+    With NumPy and enough walks, they advance together as an index vector.
+    """
+    if np is None or len(nodes) < NUMPY_MIN_WALKS:
+        return _walk_passes_python(data, is_stop, nodes)
+
+    return _walk_passes_numpy(data, is_stop, nodes)
+
+
+def _walk_passes_python(
+    data: InputData,
+    is_stop: bytearray,
+    nodes: list[int],
+) -> tuple[list[int], list[list[int]]]:
+    # Without vectors, advancing a few walks together costs more than
+    # walking them one by one
+    steps = [
+        data.left if instruction == "L" else data.right
+        for instruction in data.instructions
     ]
-    answer = math.lcm(*path_lengths)
+
+    ends, stops = [], []
+    for node in nodes:
+        node_stops = []
+        for step, next_nodes in enumerate(steps):
+            if is_stop[node]:
+                node_stops.append(step)
+            node = next_nodes[node]
+
+        ends.append(node)
+        stops.append(node_stops)
+
+    return ends, stops
+
+
+def _walk_passes_numpy(
+    data: InputData,
+    is_stop: bytearray,
+    nodes: list[int],
+) -> tuple[list[int], list[list[int]]]:
+    left, right = np.asarray(data.left), np.asarray(data.right)
+    is_stop = np.frombuffer(is_stop, dtype=np.bool_)
+    nodes = np.asarray(nodes, dtype=left.dtype)
+
+    stops = [[] for _ in range(len(nodes))]
+
+    for step, instruction in enumerate(data.instructions):
+        for walk_idx in np.flatnonzero(is_stop[nodes]).tolist():
+            stops[walk_idx].append(step)
+
+        nodes = (left if instruction == "L" else right)[nodes]
+
+    return nodes.tolist(), stops
+
+
+def find_cycle(node: int) -> Generator[int, int, tuple[int, int]]:
+    """Number of steps before the cycle and length of the cycle of the
+    sequence `node`, `f(node)`, ... (Brent's algorithm).
+
+    Yields the nodes to apply `f` to, and is sent the results, so that the
+    searches of several sequences can be advanced together.
+    """
+    power = cycle_length = 1
+    tortoise, hare = node, (yield node)
+    while tortoise != hare:
+        if power == cycle_length:
+            tortoise = hare
+            power *= 2
+            cycle_length = 0
+
+        hare = yield hare
+        cycle_length += 1
+
+    tortoise = hare = node
+    for _ in range(cycle_length):
+        hare = yield hare
+
+    n_pre_steps = 0
+    while tortoise != hare:
+        tortoise, hare = (yield tortoise), (yield hare)
+        n_pre_steps += 1
+
+    return n_pre_steps, cycle_length
+
+
+def analyse_cycles(
+    data: InputData,
+    is_stop: bytearray,
+    nodes: list[int],
+) -> list[GhostCycle]:
+    """Finds the cycles of the walks from the nodes.
+
+    The (node, instruction index) states of a walk repeat once a node comes
+    back at the start of a pass, so the cycles are searched over the nodes at
+    the starts of the passes. Passes are only walked from the nodes the
+    searches reach (all the searches' next passes at once), and remembered.
+    """
+    pass_ends = {}
+    pass_stops = {}
+
+    searches = [find_cycle(node) for node in nodes]
+    requests = dict(enumerate(map(next, searches)))
+    results = [None] * len(searches)
+
+    while requests:
+        new_nodes = list(set(requests.values()).difference(pass_ends))
+        if new_nodes:
+            ends, stops = walk_passes(data, is_stop, new_nodes)
+            pass_ends.update(zip(new_nodes, ends))
+            pass_stops.update(zip(new_nodes, stops))
+
+        for search_idx, node in list(requests.items()):
+            search = searches[search_idx]
+            try:
+                requests[search_idx] = search.send(pass_ends[node])
+            except StopIteration as stop:
+                results[search_idx] = stop.value
+                del requests[search_idx]
+
+    pass_length = len(data.instructions)
+
+    cycles = []
+    for node, (n_pre_passes, n_passes) in zip(nodes, results):
+        # The searches walked all the passes up to the end of the cycle
+        stops = []
+        for pass_idx in range(n_pre_passes + n_passes):
+            offset = pass_idx * pass_length
+            stops.extend(offset + step for step in pass_stops[node])
+            node = pass_ends[node]
+
+        cycle_start = n_pre_passes * pass_length
+        cycles.append(GhostCycle(
+            cycle_start=cycle_start,
+            period=n_passes * pass_length,
+            pre_stops=[step for step in stops if step < cycle_start],
+            cycle_stops=[step for step in stops if step >= cycle_start],
+        ))
+
+    return cycles
+
+
+def combine_congruences(
+    a1: int, m1: int, a2: int, m2: int,
+) -> tuple[int, int] | None:
+    """Solution `x = a (mod m)` of `x = a1 (mod m1)` and `x = a2 (mod m2)`,
+    with moduli that don't have to be coprime (None if there isn't any)."""
+    gcd = math.gcd(m1, m2)
+    if (a2 - a1) % gcd:
+        return None
+
+    m = m1 // gcd * m2
+    k = (a2 - a1) // gcd * pow(m1 // gcd, -1, m2 // gcd) % (m2 // gcd)
+
+    return (a1 + m1 * k) % m, m
+
+
+def minimal_period(residues: set[int], period: int) -> tuple[set[int], int]:
+    """Shortest period of the steps with these residues (e.g. stops every
+    3 steps within a cycle of 6 steps)."""
+    first = min(residues)
+
+    for shift in sorted(residue - first for residue in residues):
+        if shift and period % shift == 0 and all(
+            (residue + shift) % period in residues for residue in residues
+        ):
+            return {residue % shift for residue in residues}, shift
+
+    return residues, period
+
+
+def first_common_stop(cycles: list[GhostCycle]) -> int:
+    """First step at which all the walks are on stop nodes."""
+    start = max(cycle.cycle_start for cycle in cycles)
+
+    # Before all the walks are in their cycles, the stops of each can be listed
+    common_stops = None
+    for cycle in cycles:
+        stops = {step for step in cycle.pre_stops if step < start}
+        for stop in cycle.cycle_stops:
+            stops.update(range(stop, start, cycle.period))
+
+        common_stops = stops if common_stops is None else common_stops & stops
+
+    if common_stops:
+        return min(common_stops)
+
+    # Afterwards, the step must be one of the stops in the cycle of each walk
+    # modulo its period
+    if not all(cycle.cycle_stops for cycle in cycles):
+        raise ValueError("The walks are never on stop nodes at the same time")
+
+    congruences = [(0, 1)]
+    for cycle in cycles:
+        residues, period = minimal_period(
+            {stop % cycle.period for stop in cycle.cycle_stops}, cycle.period,
+        )
+        congruences = [
+            combined
+            for a, m in congruences
+            for residue in residues
+            if (combined := combine_congruences(a, m, residue, period))
+        ]
+
+    if not congruences:
+        raise ValueError("The walks are never on stop nodes at the same time")
+
+    return min(start + (a - start) % m for a, m in congruences)
+
+
+def solve_part_one(data: InputData) -> int:
+    is_stop = bytearray(len(data.names))
+    is_stop[data.node_ids["ZZZ"]] = 1
+
+    return first_stop(data, is_stop, data.node_ids["AAA"])
+
+
+def solve_part_two(data: InputData, max_workers: int | None = 1) -> int:
+    """With `max_workers` other than 1, the cycles of the walks are found in
+    a process pool (`None` for one worker per CPU)."""
+    is_stop = stop_mask(data, "Z")
+
+    start_nodes = [
+        node_id
+        for name, node_id in data.node_ids.items()
+        if name.endswith("A")
+    ]
+
+    if max_workers == 1:
+        cycles = analyse_cycles(data, is_stop, start_nodes)
+    else:
+        n_chunks = max_workers or os.cpu_count() or 1
+        chunks = [start_nodes[idx::n_chunks] for idx in range(n_chunks)]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            cycles = [
+                cycle
+                for chunk_cycles in pool.map(
+                    partial(analyse_cycles, data, is_stop),
+                    chunks,
+                )
+                for cycle in chunk_cycles
+            ]
+
+    answer = first_common_stop(cycles)
 
     return answer
 
@@ -95,6 +372,38 @@ def run_tests():
     print("Example3 - part 2:", part_two)
     assert part_two == 6
 
+    # Walks meeting stops with offsets (lcm(2, 1) would give 2)
+    data = build_input(list("L"), [
+        ("11A", "11B", "11B"), ("11B", "11Z", "11Z"), ("11Z", "11B", "11B"),
+        ("22A", "22Z", "22Z"), ("22Z", "22B", "22B"), ("22B", "22C", "22C"),
+        ("22C", "22Z", "22Z"),
+    ])
+    assert solve_part_two(data) == 4
+    assert solve_part_two(data, max_workers=2) == 4
+    assert combine_congruences(2, 4, 3, 6) is None
+    assert combine_congruences(1, 4, 3, 6) == (9, 12)
+    assert minimal_period({1, 4, 7, 10}, 12) == ({1}, 3)
+
+    # The first walk only meets a stop before its cycle
+    data = build_input(list("L"), [
+        ("11A", "11Z", "11Z"), ("11Z", "11B", "11B"), ("11B", "11B", "11B"),
+        ("22A", "22B", "22B"), ("22B", "22Z", "22Z"), ("22Z", "22A", "22A"),
+    ])
+    try:
+        solve_part_two(data)
+    except ValueError as error:
+        assert "never on stop nodes" in str(error), error
+    else:
+        raise AssertionError("The walks have no common stop")
+
+    nodes = list(range(len(data.names)))
+    is_stop = stop_mask(data, "Z")
+    if np is not None:
+        assert _walk_passes_numpy(data, is_stop, nodes) == (
+            _walk_passes_python(data, is_stop, nodes)
+        )
+
+
 def main():
     run_tests()
 
@@ -1,54 +1,116 @@
 """Day 9"""
+import math
+import sys
+from functools import lru_cache
+from itertools import islice
+from operator import mul
+from pathlib import Path
+from typing import Iterable, Iterator
+
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.inputs import read_records
+from aoc2023.numeric import np
+
 
 InputData = list[list[int]]
 
 
+def stream_input(path: str) -> Iterator[list[int]]:
+    for line in read_records(path):
+        yield [int(n) for n in line.split(" ")]
+
+
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        return [
-            [int(n) for n in line.strip().split(" ")]
-            for line in fin.readlines()
-        ]
+    return list(stream_input(path))
 
 
-def solve_part_one(data: InputData) -> int:
-    answer = 0
+def solve_part_one(data: Iterable[list[int]], batch_size: int = 4096) -> int:
+    return sum(
+        pred_right
+        for _, pred_right in extrapolate_all(data, batch_size=batch_size)
+    )
 
-    for seq in data:
-        _, pred_right = extrapolate(seq)
-        answer += pred_right
 
-    return answer
+@lru_cache
+def extrapolation_coefficients(length: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Weights of the values of a sequence in its previous and next values.
+
+    Extrapolating the difference pyramid is extrapolating the polynomial of
+    degree < `length` through the values, which gives alternating binomial
+    coefficients: `next = sum((-1)**(length - 1 - i) * C(length, i) * seq[i])`
+    and `previous = sum((-1)**i * C(length, i + 1) * seq[i])`.
+    """
+    prev_coeffs = tuple(
+        (-1) ** i * math.comb(length, i + 1) for i in range(length)
+    )
+    next_coeffs = tuple(
+        (-1) ** (length - 1 - i) * math.comb(length, i) for i in range(length)
+    )
+
+    return prev_coeffs, next_coeffs
 
 
 def extrapolate(seq: list[int]) -> tuple[int, int]:
-    diffs = [seq]
+    prev_coeffs, next_coeffs = extrapolation_coefficients(len(seq))
+    return sum(map(mul, prev_coeffs, seq)), sum(map(mul, next_coeffs, seq))
+
+
+def extrapolate_batch(seqs: list[list[int]]) -> list[tuple[int, int]]:
+    """`extrapolate` for many sequences, with each group of sequences of the
+    same length as one matrix product if NumPy is available."""
+    if np is None:
+        return list(map(extrapolate, seqs))
 
-    while True:
-        current_diff = [b - a for b, a in zip(diffs[-1][1:], diffs[-1][:-1])] 
+    by_length = {}
+    for idx, seq in enumerate(seqs):
+        by_length.setdefault(len(seq), []).append(idx)
 
-        if all(n == 0 for n in current_diff):
-            break
-        
-        diffs.append(current_diff)
+    out = [None] * len(seqs)
+    for length, idxs in by_length.items():
+        group = [seqs[idx] for idx in idxs]
+        preds = _extrapolate_numpy(group, length)
 
-    pred_left = 0
-    pred_right = 0
-    for diff in diffs[::-1]:
-        pred_left = diff[0] - pred_left
-        pred_right += diff[-1]
+        if preds is None:
+            preds = list(map(extrapolate, group))
 
-    return pred_left, pred_right
+        for idx, pred in zip(idxs, preds):
+            out[idx] = pred
 
+    return out
 
-def solve_part_two(data: InputData) -> int:
-    answer = 0
 
-    for seq in data:
-        pred_left, _ = extrapolate(seq)
-        answer += pred_left
+def _extrapolate_numpy(seqs: list[list[int]], length: int):
+    try:
+        values = np.array(seqs, dtype=np.int64)
+    except OverflowError:
+        return None
 
-    return answer
+    # The coefficients' absolute values sum to 2**length - 1, so the products
+    # fit into int64 if the values are below 2**(63 - length)
+    if length >= 63 or np.abs(values).max(initial=0) >= 2 ** (63 - length):
+        return None
+
+    coeffs = np.array(extrapolation_coefficients(length), dtype=np.int64).T
+    return list(map(tuple, (values @ coeffs).tolist()))
+
+
+def extrapolate_all(
+    data: Iterable[list[int]],
+    batch_size: int = 4096,
+) -> Iterator[tuple[int, int]]:
+    seqs = iter(data)
+
+    while batch := list(islice(seqs, batch_size)):
+        yield from extrapolate_batch(batch)
+
+
+def solve_part_two(data: Iterable[list[int]], batch_size: int = 4096) -> int:
+    return sum(
+        pred_left
+        for pred_left, _ in extrapolate_all(data, batch_size=batch_size)
+    )
 
 
 def run_tests():
@@ -62,6 +124,13 @@ def run_tests():
     print("Example - part 2:", part_two)
     assert part_two == 2
 
+    assert solve_part_one(stream_input("data/example.txt")) == part_one
+    assert solve_part_two(stream_input("data/example.txt")) == part_two
+
+    assert extrapolate([10, 13, 16, 21, 30, 45]) == (5, 68)
+    assert extrapolate_batch([[1, 2], [3], [0, 0, 0]]) == [(0, 3), (3, 3), (0, 0)]
+    assert extrapolation_coefficients(3) == ((3, -3, 1), (1, -3, 3))
+
 
 def main():
     run_tests()
@@ -1,6 +1,13 @@
 """Day 10"""
+import sys
+from pathlib import Path
 from typing import NamedTuple
 
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.grid import Grid
+
 
 class Position(NamedTuple):
     x: int
@@ -19,108 +26,100 @@ class Position(NamedTuple):
         return Position(self.x + 1, self.y)
 
 
+NORTH, SOUTH, WEST, EAST = (0, -1), (0, 1), (-1, 0), (1, 0)
+
+# Directions connected by each pipe
+PIPE_DIRECTIONS = {
+    ord("|"): (NORTH, SOUTH),
+    ord("-"): (WEST, EAST),
+    ord("L"): (NORTH, EAST),
+    ord("J"): (NORTH, WEST),
+    ord("7"): (SOUTH, WEST),
+    ord("F"): (SOUTH, EAST),
+}
+
+
 class InputData(NamedTuple):
     start_pos: Position
-    pipes: dict[Position, str]
-    edges: dict[Position, tuple[Position, Position]]
+    start_pipe: int  # The pipe under "S"
+    pipes: Grid
 
 
-def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        pipes = {}
-        start_pos = None
-
-        for y, line in enumerate(fin.readlines()):
-            for x, pipe in enumerate(line.strip()):
-                pos = Position(x, y)
+def get_pipe(pipes: Grid, pos: Position) -> int:
+    return pipes.get((pos.y, pos.x), ord("."))
 
-                pipes[pos] = pipe
 
-                if pipe == "S":
-                    start_pos = pos
+def parse_input(path: str) -> InputData:
+    pipes = Grid.map_file(path)
 
-        # Get neighbors
-        edges = {}
+    start_y, start_x = pipes.find(ord("S"))
+    start_pos = Position(start_x, start_y)
 
-        for pos, pipe in pipes.items():
-            neighbors = []
-        
-            if (
-                pipe in ("S", "|", "L", "J") 
-                and pipes.get(pos.north()) in ("|", "7", "F")
-            ):
-                neighbors.append(pos.north())
+    return InputData(
+        start_pos=start_pos,
+        start_pipe=resolve_start_pipe(pipes, start_pos),
+        pipes=pipes,
+    )
 
-            if (
-                pipe in ("S", "|", "7", "F")
-                and pipes.get(pos.south()) in ("|", "L", "J")
-            ):
-                neighbors.append(pos.south())
 
-            if (
-                pipe in ("S", "-", "J", "7")
-                and pipes.get(pos.west()) in ("-", "L", "F")
-            ):
-                neighbors.append(pos.west())
+def resolve_start_pipe(pipes: Grid, start_pos: Position) -> int:
+    """Pipe connecting the start to the two neighbors connected to it."""
+    directions = []
 
-            if (
-                pipe in ("S", "-", "L", "F")
-                and pipes.get(pos.east()) in ("-", "J", "7")
-            ):
-                neighbors.append(pos.east())
+    if get_pipe(pipes, start_pos.north()) in b"|7F":
+        directions.append(NORTH)
+    if get_pipe(pipes, start_pos.south()) in b"|LJ":
+        directions.append(SOUTH)
+    if get_pipe(pipes, start_pos.west()) in b"-LF":
+        directions.append(WEST)
+    if get_pipe(pipes, start_pos.east()) in b"-J7":
+        directions.append(EAST)
 
-            assert len(neighbors) <= 2, f"{pos} has {len(neighbors)} neighbors"
-            edges[pos] = neighbors
+    for pipe, pipe_directions in PIPE_DIRECTIONS.items():
+        if list(pipe_directions) == directions:
+            return pipe
 
-        return InputData(start_pos=start_pos, pipes=pipes, edges=edges)
+    raise ValueError(f"The start {start_pos} is connected to {len(directions)} pipes")
 
 
 def solve_part_one(data: InputData) -> int:
-    dists = find_loop(data)
-    answer = max(dists.values())
+    loop = find_loop(data)
+    answer = len(loop) // 2
 
     return answer
 
 
-def find_loop(data: InputData) -> dict[Position, int]:
-    dists: dict[Position, int] = {}
-    visited: set[Position] = set()
-
-    queue = [(data.start_pos, 0)]
+def find_loop(data: InputData) -> list[Position]:
+    """Positions of the loop's pipes, in order, ending with the start."""
+    loop = []
 
-    while queue:
-        pos, dist = queue.pop(0)
+    pos = data.start_pos
+    direction = PIPE_DIRECTIONS[data.start_pipe][0]
 
-        if pos in visited:
-            continue
+    while True:
+        pos = Position(pos.x + direction[0], pos.y + direction[1])
+        loop.append(pos)
 
-        visited.add(pos)
-        dists[pos] = dist
+        if pos == data.start_pos:
+            return loop
 
-        for n_pos in data.edges.get(pos, []):
-            queue.append((n_pos, dist + 1))
-
-    return dists
+        came_from = (-direction[0], -direction[1])
+        first, second = PIPE_DIRECTIONS[get_pipe(data.pipes, pos)]
+        direction = second if first == came_from else first
 
 
 def solve_part_two(data: InputData) -> int:
-    dists = find_loop(data)
-    loop_pipes = set(dists.keys())
-
-    answer = 0
+    """Counts the tiles inside the loop with Pick's theorem, from the area
+    enclosed by the loop (shoelace formula) and its number of tiles."""
+    loop = find_loop(data)
 
-    for pos in data.pipes.keys():
-        if pos in loop_pipes:
-            continue
+    double_area = 0
+    prev = loop[-1]
+    for pos in loop:
+        double_area += prev.x * pos.y - pos.x * prev.y
+        prev = pos
 
-        n_west = len([
-            p 
-            for p in loop_pipes 
-            if p.y == pos.y and p.x < pos.x
-            and data.pipes[p] in ("|", "J", "L", "S")
-        ])
-
-        answer += n_west % 2 == 1
+    answer = abs(double_area) // 2 - len(loop) // 2 + 1
 
     return answer
 
@@ -138,18 +137,19 @@ def run_tests():
     print("Example2 - part 1:", part_one)
     assert part_one == 4
 
-    # Off by one error if counting "S"
-#    data = parse_input("data/example3.txt")
-#
-#    part_two = solve_part_two(data)
-#    print("Example3 - part 2:", part_two)
-#    assert part_two == 4
-
-#    data = parse_input("data/example4.txt")
-#
-#    part_two = solve_part_two(data)
-#    print("Example4 - part 2:", part_two)
-#    assert part_two == 8
+    data = parse_input("data/example3.txt")
+    assert data.start_pipe == ord("F")
+
+    part_two = solve_part_two(data)
+    print("Example3 - part 2:", part_two)
+    assert part_two == 4
+
+    data = parse_input("data/example4.txt")
+    assert data.start_pipe == ord("F")
+
+    part_two = solve_part_two(data)
+    print("Example4 - part 2:", part_two)
+    assert part_two == 8
 
     data = parse_input("data/example5.txt")
 
@@ -1,17 +1,19 @@
 """Day 11"""
-from itertools import combinations
-from typing import NamedTuple
+import sys
+from itertools import accumulate, combinations
+from pathlib import Path
 
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-InputData = list[list[str]]
+from aoc2023.grid import Grid
+
+
+InputData = Grid
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        return [
-            [c for c in line.strip()]
-            for line in fin.readlines()
-        ]
+    return Grid.map_file(path)
 
 
 def solve_part_one(data: InputData) -> int:
@@ -34,13 +36,7 @@ def compute_shortest_distances(
     image: InputData,
     expansion_rate: int,
 ) -> list[int]:
-    expanded_image = expand(image, expansion_rate)
-    galaxy_positions = [
-        (y, x)
-        for y, row in enumerate(expanded_image)
-        for x, pixel in enumerate(row)
-        if pixel == "#"
-    ]
+    galaxy_positions = expand(image, expansion_rate)
 
     shortest_distances = []
     for (y1, x1), (y2, x2) in combinations(galaxy_positions, r=2):
@@ -49,33 +45,27 @@ def compute_shortest_distances(
     return shortest_distances
 
 
-def expand(image: InputData, expansion_rate: int) -> InputData:
-    out = []
-
-    # Expand rows
-    for row in image:
-        out.append(row)
-
-        if set(row) == {"."}:
-            out.extend([row] * (expansion_rate - 1))
-
-    # Expand columns
-    x = 0
-    while x < len(out[0]):
-        if all(row[x] == "." for row in out):
-            out = [
-                [
-                    *row[:x],
-                    *["."] * (expansion_rate - 1),
-                    *row[x:],
-                ]
-                for row in out
-            ]
-            x += expansion_rate - 1
-
-        x += 1
-
-    return out
+def expand(image: InputData, expansion_rate: int) -> list[tuple[int, int]]:
+    """Returns the galaxy positions after expanding the empty rows/columns."""
+    galaxy = ord("#")
+
+    # Number of empty rows (columns) before each row (column)
+    row_offsets = list(accumulate(
+        (galaxy not in row for row in image.rows()),
+        initial=0,
+    ))
+    col_offsets = list(accumulate(
+        (galaxy not in col for col in image.cols()),
+        initial=0,
+    ))
+
+    return [
+        (
+            y + row_offsets[y] * (expansion_rate - 1),
+            x + col_offsets[x] * (expansion_rate - 1),
+        )
+        for y, x in image.find_all(galaxy)
+    ]
 
 
 def run_tests():
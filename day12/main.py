@@ -1,8 +1,15 @@
 """Day 12"""
+import sys
 from functools import cache
 from itertools import product
+from pathlib import Path
 from typing import Generator, NamedTuple
 
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.inputs import read_records
+
 
 class SpringInfo(NamedTuple):
     state: tuple[str, ...]
@@ -13,14 +20,13 @@ InputData = list[SpringInfo]
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        data = []
-        for line in fin.readlines():
-            state_raw, sizes_raw = line.strip().split(" ")
-            sizes = tuple(int(s) for s in sizes_raw.split(","))
-            data.append(SpringInfo(state=tuple(state_raw), sizes=sizes))
-
-        return data
+    data = []
+    for line in read_records(path):
+        state_raw, sizes_raw = line.split(" ")
+        sizes = tuple(int(s) for s in sizes_raw.split(","))
+        data.append(SpringInfo(state=tuple(state_raw), sizes=sizes))
+
+    return data
 
 
 def solve_part_one(data: InputData) -> int:
@@ -1,18 +1,23 @@
 """Day 13"""
-from typing import NamedTuple
+import sys
+from pathlib import Path
 
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-Pattern = list[str]
+from aoc2023.grid import Grid
+from aoc2023.inputs import read_records
+
+
+Pattern = Grid
 InputData = list[Pattern]
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        data = []
-        for pattern_raw in fin.read().split("\n\n"):
-            data.append(pattern_raw.strip().split("\n"))
-
-        return data
+    return [
+        Grid.from_rows(pattern_raw.split("\n"))
+        for pattern_raw in read_records(path, separator="\n\n")
+    ]
 
 
 def solve_part_one(data: InputData) -> int:
@@ -43,22 +48,7 @@ def find_horizontal_reflection_idx(
     pattern: Pattern,
     accepted_diffs: int,
 ) -> int | None:
-    idxs = []
-
-    for idx in range(len(pattern) - 1):
-        rows_to_compare = [
-            (idx - i, idx + i + 1)
-            for i in range(idx + 1) 
-            if idx - i >= 0 and idx + i + 1 < len(pattern)
-        ]
-
-        num_diffs = 0
-
-        for i, j in rows_to_compare:
-            num_diffs += compare_fn(pattern[i], pattern[j])
-
-        if num_diffs == accepted_diffs:
-            idxs.append(idx)
+    idxs = find_reflection_idxs(pattern, accepted_diffs)
 
     if len(idxs) == 1:
         return idxs[0]
@@ -74,39 +64,48 @@ def find_vertical_reflection_idx(
     pattern: Pattern,
     accepted_diffs: int,
 ) -> int | None:
+    # Columns of the pattern are the rows of its transposed view
+    idxs = find_reflection_idxs(pattern.transpose(), accepted_diffs)
+
+    if len(idxs) == 1:
+        return idxs[0]
+    elif len(idxs) == 0:
+        return None
+    else:
+        raise RuntimeError(
+            "Pattern should have at most one vertical reflection"
+        )
+
+
+def find_reflection_idxs(pattern: Pattern, accepted_diffs: int) -> list[int]:
+    """Rows after which the pattern is reflected (up to `accepted_diffs`)."""
+    rows = [bytes(row) for row in pattern.rows()]
     idxs = []
 
-    for idx in range(len(pattern[0]) - 1):
-        cols_to_compare = [
+    for idx in range(pattern.height - 1):
+        rows_to_compare = [
             (idx - i, idx + i + 1)
             for i in range(idx + 1) 
-            if idx - i >= 0 and idx + i + 1 < len(pattern[0])
+            if idx - i >= 0 and idx + i + 1 < pattern.height
         ]
 
         num_diffs = 0
 
-        for i, j in cols_to_compare:
-            num_diffs += compare_fn(
-                first=[row[i] for row in pattern],
-                second=[row[j] for row in pattern],
-            )
+        for i, j in rows_to_compare:
+            num_diffs += compare_fn(rows[i], rows[j])
 
         if num_diffs == accepted_diffs:
             idxs.append(idx)
 
-    if len(idxs) == 1:
-        return idxs[0]
-    elif len(idxs) == 0:
-        return None
-    else:
-        raise RuntimeError(
-            "Pattern should have at most one vertical reflection"
-        )
+    return idxs
 
 
-def compare_fn(first: str, second: str) -> int:
+def compare_fn(first: bytes, second: bytes) -> int:
     """Returns the number of different characters between the inputs."""
     assert len(first) == len(second)
+    if first == second:
+        return 0
+
     diff = len(first)
 
     for a, b in zip(first, second):
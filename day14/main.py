@@ -1,14 +1,18 @@
 """Day 14"""
-from copy import deepcopy
-from typing import NamedTuple
+import sys
+from pathlib import Path
 
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-InputData = list[list[str]]
+from aoc2023.grid import Grid
+
+
+InputData = Grid
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        return [list(row.strip()) for row in fin.readlines()]
+    return Grid.map_file(path)
 
 
 def solve_part_one(data: InputData) -> int:
@@ -18,13 +22,13 @@ def solve_part_one(data: InputData) -> int:
 
 def solve_part_two(data: InputData) -> int:
     max_iter = 1_000_000_000
-    out = deepcopy(data)
+    out = data
 
     cache = {}
     i = 0
 
     while True:
-        key = to_tuple(out)
+        key = out  # Tilting creates new grids, so keys are never modified
         if key in cache:
             break
         
@@ -38,16 +42,12 @@ def solve_part_two(data: InputData) -> int:
     num_steps = (max_iter - i) % cycle_length
 
     for _ in range(num_steps):
-        out, _ = cache[to_tuple(out)]
+        out, _ = cache[out]
 
     total_support_load = compute_north_support_load(out)
     return total_support_load
 
 
-def to_tuple(x: InputData) -> tuple[str]:
-    return tuple(''.join(row) for row in x)
-
-
 def make_full_cycle(data: InputData) -> InputData:
     out = tilt_north(data)
     out = tilt_west(out)
@@ -56,50 +56,38 @@ def make_full_cycle(data: InputData) -> InputData:
     return out
 
 
-def tilt_north(data: InputData) -> InputData:
-    out = deepcopy(data)
+def tilt_west(data: InputData) -> InputData:
+    return Grid.from_rows(roll_west(bytes(row)) for row in data.rows())
 
-    for row_idx, row in enumerate(out[1:], start=1):
-        for col_idx, c in enumerate(row):
-            if c == "O":  # Find rolling rocks 
-                i = row_idx
-                while i >= 1 and out[i - 1][col_idx] == ".":  # Move them north
-                    out[i - 1][col_idx] = "O"
-                    out[i][col_idx] = "."
 
-                    i -= 1
-    return out
+def roll_west(row: bytes) -> bytes:
+    """Moves the rolling rocks west, until they hit a cube-shaped rock."""
+    segments = []
 
+    for segment in row.split(b"#"):
+        n_rolling = segment.count(b"O")
+        segments.append(b"O" * n_rolling + b"." * (len(segment) - n_rolling))
 
-def tilt_west(data: InputData) -> InputData:
-    out = deepcopy(data)
+    return b"#".join(segments)
 
-    for row_idx in range(len(out)):
-        for col_idx in range(1, len(out[0])):
-            if out[row_idx][col_idx] == "O":  # Find rolling rocks 
-                i = col_idx
-                while i >= 1 and out[row_idx][i - 1] == ".":  # Move them west
-                    out[row_idx][i - 1] = "O"
-                    out[row_idx][i] = "."
 
-                    i -= 1
-    return out
+def tilt_north(data: InputData) -> InputData:
+    return tilt_west(data.transpose()).transpose()
 
 
 def tilt_south(data: InputData) -> InputData:
-    return tilt_north(data[::-1])[::-1]
+    return tilt_north(data.flip_rows()).flip_rows()
 
 
 def tilt_east(data: InputData) -> InputData:
-    out = tilt_west([row[::-1] for row in data])
-    return [row[::-1] for row in out]
+    return tilt_west(data.flip_cols()).flip_cols()
 
 
 def compute_north_support_load(data: InputData) -> int:
     support_load = 0
 
-    for row_idx, row in enumerate(data):
-        row_load = (len(data) - row_idx) * row.count("O")
+    for row_idx, row in enumerate(data.rows()):
+        row_load = (data.height - row_idx) * bytes(row).count(b"O")
         support_load += row_load
 
     return support_load
@@ -1,14 +1,25 @@
 """Day 15"""
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator
+
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.inputs import read_records
 
 InputData = list[str]
 
 
+def stream_input(path: str) -> Iterator[str]:
+    return read_records(path, separator=",")
+
+
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        return fin.read().strip().split(",")
+    return list(stream_input(path))
 
 
-def solve_part_one(data: InputData) -> int:
+def solve_part_one(data: Iterable[str]) -> int:
     answer = 0
 
     for instruction in data:
@@ -28,7 +39,7 @@ def hash(string: str) -> int:
     return current_value
 
 
-def solve_part_two(data: InputData) -> int:
+def solve_part_two(data: Iterable[str]) -> int:
     boxes = [[] for _ in range(256)]
 
     for instruction in data:
@@ -75,6 +86,9 @@ def run_tests():
     print("Example - part 2:", part_two)
     assert part_two == 145
 
+    assert solve_part_one(stream_input("data/example.txt")) == part_one
+    assert solve_part_two(stream_input("data/example.txt")) == part_two
+
 
 def main():
     run_tests()
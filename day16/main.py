@@ -1,18 +1,24 @@
 """Day 16"""
+import sys
+from pathlib import Path
 from typing import NamedTuple
 
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.grid import Grid
+
 
 class Beam(NamedTuple):
     position: tuple[int, int]
     direction: tuple[int, int]
 
 
-InputData = list[list[str]]
+InputData = Grid
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        return [list(line.strip()) for line in fin.readlines()]
+    return Grid.map_file(path)
 
 
 def solve_part_one(data: InputData) -> int:
@@ -30,22 +36,22 @@ def solve_part_two(data: InputData) -> int:
         # Top
         *[
             Beam(position=(x, 0), direction=(0, 1))
-            for x in range(len(data[0]))
+            for x in range(data.width)
         ],
         # Bottom
         *[
-            Beam(position=(x, len(data) - 1), direction=(0, -1))
-            for x in range(len(data[0]))
+            Beam(position=(x, data.height - 1), direction=(0, -1))
+            for x in range(data.width)
         ],
         # Left
         *[
             Beam(position=(0, y), direction=(1, 0))
-            for y in range(len(data))
+            for y in range(data.height)
         ],
         # Right
         *[
-            Beam(position=(len(data[0]) - 1, y), direction=(-1, 0))
-            for y in range(len(data))
+            Beam(position=(data.width - 1, y), direction=(-1, 0))
+            for y in range(data.height)
         ],
     ]
 
@@ -64,7 +70,8 @@ def solve_part_two(data: InputData) -> int:
 
 
 def trace_beam(grid: InputData, start_beam: Beam) -> list[list[int]]:
-    energies = [[0] * len(grid[0]) for _ in range(len(grid))]
+    energies = [[0] * grid.width for _ in range(grid.height)]
+    cells, row_stride, col_stride = grid.cells, grid.row_stride, grid.col_stride
 
     beams = [start_beam]
     traced = set()
@@ -72,7 +79,7 @@ def trace_beam(grid: InputData, start_beam: Beam) -> list[list[int]]:
     while beams:
         (x, y), (dx, dy) = beams.pop(0)
 
-        if x < 0 or x >= len(grid[0]) or y < 0 or y >= len(grid):
+        if x < 0 or x >= grid.width or y < 0 or y >= grid.height:
             continue
 
         if (x, y, dx, dy) in traced:
@@ -84,9 +91,11 @@ def trace_beam(grid: InputData, start_beam: Beam) -> list[list[int]]:
         energies[y][x] += 1
 
         # Update beam
-        if grid[y][x] == ".":
+        tile = chr(cells[grid.offset + y * row_stride + x * col_stride])
+
+        if tile == ".":
             pass
-        elif grid[y][x] == "/":
+        elif tile == "/":
             if dx == 1:  # Right-moving
                 dx, dy = 0, -1
             elif dx == -1:  # Left-moving
@@ -96,7 +105,7 @@ def trace_beam(grid: InputData, start_beam: Beam) -> list[list[int]]:
                     dx, dy = 1, 0
                 elif dy == 1:  # Down-moving
                     dx, dy = -1, 0
-        elif grid[y][x] == "\\":
+        elif tile == "\\":
             if dx == 1:  # Right-moving
                 dx, dy = 0, 1
             elif dx == -1:  # Left-moving
@@ -106,18 +115,18 @@ def trace_beam(grid: InputData, start_beam: Beam) -> list[list[int]]:
                     dx, dy = -1, 0
                 elif dy == 1:  # Down-moving
                     dx, dy = 1, 0
-        elif grid[y][x] == "|":
+        elif tile == "|":
             if dx == 1 or dx == -1:
                 beams.append(Beam(position=(x, y - 1), direction=(0, -1)))
                 beams.append(Beam(position=(x, y + 1), direction=(0, 1)))
                 continue
-        elif grid[y][x] == "-":
+        elif tile == "-":
             if dy == 1 or dy == -1:
                 beams.append(Beam(position=(x - 1, y), direction=(-1, 0)))
                 beams.append(Beam(position=(x + 1, y), direction=(1, 0)))
                 continue
         else:
-            raise ValueError(f"Unknown tile: '{grid[y][x]}'")
+            raise ValueError(f"Unknown tile: '{tile}'")
 
         beams.append(Beam(position=(x + dx, y + dy), direction=(dx, dy)))
 
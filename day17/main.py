@@ -1,19 +1,25 @@
 """Day 17"""
 import heapq
+import sys
+from pathlib import Path
 
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-InputData = list[list[int]]
+from aoc2023.grid import Grid
+
+
+InputData = Grid  # Heat loss digits
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        return [[int(d) for d in row.strip()] for row in fin.readlines()]
+    return Grid.map_file(path)
 
 
 def solve_part_one(data: InputData) -> int:
     return find_shortest_path(
         start_point=(0, 0),
-        end_point=(len(data) - 1, len(data[0]) - 1),
+        end_point=(data.height - 1, data.width - 1),
         heat_map=data,
         min_straight_steps=1,
         max_straight_steps=3,
@@ -23,7 +29,7 @@ def solve_part_one(data: InputData) -> int:
 def solve_part_two(data: InputData) -> int:
     return find_shortest_path(
         start_point=(0, 0),
-        end_point=(len(data) - 1, len(data[0]) - 1),
+        end_point=(data.height - 1, data.width - 1),
         heat_map=data,
         min_straight_steps=4,
         max_straight_steps=10,
@@ -50,6 +56,10 @@ def find_shortest_path(
     heapq.heapify(queue)
     visited = set()
 
+    cells, offset = heat_map.cells, heat_map.offset
+    row_stride, col_stride = heat_map.row_stride, heat_map.col_stride
+    zero = ord("0")
+
     while queue:
         distance, (i, j, direction) = heapq.heappop(queue)
 
@@ -68,12 +78,14 @@ def find_shortest_path(
                 new_i, new_j = i + di * num_steps, j + dj * num_steps
 
                 if (
-                    new_i < 0 or new_i >= len(heat_map)
-                    or new_j < 0 or new_j >= len(heat_map[0])
+                    new_i < 0 or new_i >= heat_map.height
+                    or new_j < 0 or new_j >= heat_map.width
                 ):
                     break
 
-                new_distance += heat_map[new_i][new_j]
+                new_distance += (
+                    cells[offset + new_i * row_stride + new_j * col_stride] - zero
+                )
 
                 if (new_i, new_j, FLIP_DIRECTION[direction]) in visited:
                     continue
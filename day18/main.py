@@ -1,6 +1,13 @@
 """Day 18"""
+import sys
+from pathlib import Path
 from typing import Literal, NamedTuple
 
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.inputs import read_records
+
 
 class Instruction(NamedTuple):
     direction: Literal["U", "D", "L", "R"]
@@ -17,8 +24,7 @@ InputData = list[Instruction]
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        return [Instruction.from_raw(line) for line in fin.readlines()]
+    return [Instruction.from_raw(line) for line in read_records(path)]
 
 
 def solve_part_one(data: InputData) -> int:
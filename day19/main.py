@@ -1,6 +1,13 @@
 """Day 19"""
+import sys
+from pathlib import Path
 from typing import Literal, NamedTuple
 
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.inputs import read_records
+
 
 class ComparisonRule(NamedTuple):
     param_name: str
@@ -61,25 +68,24 @@ class InputData(NamedTuple):
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        workflows_raw, parts_raw = fin.read().strip().split("\n\n")
+    workflows_raw, parts_raw = read_records(path, separator="\n\n")
 
-        workflows = {}
-        for line in workflows_raw.split("\n"):
-            idx = line.index("{")
-            name = line[:idx]
-            rules = [
-                ComparisonRule.from_raw(raw)
-                if any(op in raw for op in (">", "<"))
-                else JumpRule(raw)
-                for raw in line[idx + 1:-1].split(",")
-            ]
+    workflows = {}
+    for line in workflows_raw.split("\n"):
+        idx = line.index("{")
+        name = line[:idx]
+        rules = [
+            ComparisonRule.from_raw(raw)
+            if any(op in raw for op in (">", "<"))
+            else JumpRule(raw)
+            for raw in line[idx + 1:-1].split(",")
+        ]
 
-            workflows[name] = rules
+        workflows[name] = rules
 
-        parts = [Part.from_raw(raw) for raw in parts_raw.split("\n")]
+    parts = [Part.from_raw(raw) for raw in parts_raw.split("\n")]
 
-        return InputData(workflows=workflows, parts=parts)
+    return InputData(workflows=workflows, parts=parts)
 
 
 def solve_part_one(data: InputData) -> int:
@@ -1,8 +1,15 @@
 """Day 20"""
 import math
+import sys
 from abc import abstractmethod
+from pathlib import Path
 from typing import NamedTuple
 
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.inputs import read_records
+
 
 Pulse = bool
 State = bool
@@ -78,37 +85,36 @@ InputData = dict[str, FlipFlop | Conjunction | Broadcaster]
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        circuit = {}
+    circuit = {}
 
-        for line in fin.readlines():
-            module_name, outputs = line.strip().split(" -> ")
+    for line in read_records(path):
+        module_name, outputs = line.split(" -> ")
             
-            if module_name == "broadcaster":
-                m = Broadcaster()
-            else:
-                module_type = module_name[0]
-                module_name = module_name[1:]
+        if module_name == "broadcaster":
+            m = Broadcaster()
+        else:
+            module_type = module_name[0]
+            module_name = module_name[1:]
 
-                if module_type == "%":
-                    m = FlipFlop(name=module_name)
-                elif module_type == "&":
-                    m = Conjunction(name=module_name)
+            if module_type == "%":
+                m = FlipFlop(name=module_name)
+            elif module_type == "&":
+                m = Conjunction(name=module_name)
 
-            for out in outputs.split(", "):
-                m.add_output(out)
+        for out in outputs.split(", "):
+            m.add_output(out)
 
-            circuit[module_name] = m
+        circuit[module_name] = m
         
-        # Attach all inputs
-        for input_name, module in circuit.items():
-            for out in module.outputs:
-                if out not in circuit:
-                    continue
+    # Attach all inputs
+    for input_name, module in circuit.items():
+        for out in module.outputs:
+            if out not in circuit:
+                continue
 
-                circuit[out].add_input(input_name)
+            circuit[out].add_input(input_name)
 
-        return circuit
+    return circuit
 
 
 def solve_part_one(circuit: InputData) -> int:
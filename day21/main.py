@@ -1,12 +1,18 @@
 """Day 21"""
+import sys
+from pathlib import Path
 
-InputData = list[list[str]]
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.grid import Grid
+
+InputData = Grid
 Position = tuple[int, int]
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        return [list(line.strip()) for line in fin.readlines()]
+    return Grid.map_file(path)
 
 
 def solve_part_one(data: InputData, max_steps: int = 64) -> int:
@@ -19,12 +25,11 @@ def solve_part_one(data: InputData, max_steps: int = 64) -> int:
 
 
 def traverse(grid: InputData) -> dict[Position, int]:
-    start_pos = [
-        (i, j)
-        for i, row in enumerate(grid)
-        for j, c in enumerate(row)
-        if c == "S"
-    ][0]
+    start_pos = grid.find(ord("S"))
+
+    cells, offset = grid.cells, grid.offset
+    row_stride, col_stride = grid.row_stride, grid.col_stride
+    rock = ord("#")
 
     queue = [(start_pos, 0)]
     distances = {}
@@ -44,12 +49,12 @@ def traverse(grid: InputData) -> dict[Position, int]:
             new_i, new_j = i + di, j + dj
 
             if (
-                new_i < 0 or new_i >= len(grid)
-                or new_j < 0 or new_j >= len(grid[0])
+                new_i < 0 or new_i >= grid.height
+                or new_j < 0 or new_j >= grid.width
             ):
                 continue
 
-            if grid[new_i][new_j] == "#":
+            if cells[offset + new_i * row_stride + new_j * col_stride] == rock:
                 continue
 
             queue.append(((new_i, new_j), distance + 1))
@@ -59,7 +64,7 @@ def traverse(grid: InputData) -> dict[Position, int]:
 
 def solve_part_two(data: InputData, max_steps: int = 26_501_365) -> int:
     """https://github.com/villuna/aoc23/wiki/A-Geometric-solution-to-advent-of-code-2023,-day-21"""
-    width = len(data[0])
+    width = data.width
     threshold = width // 2
 
     distances = traverse(grid=data)
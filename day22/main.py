@@ -1,7 +1,14 @@
 """Day 22"""
+import sys
 from functools import cache
+from pathlib import Path
 from typing import NamedTuple
 
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.inputs import read_records
+
 
 class Position3D(NamedTuple):
     x: int
@@ -56,8 +63,7 @@ InputData = list[Brick]
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        return [Brick.from_raw(line) for line in fin.readlines()]
+    return [Brick.from_raw(line) for line in read_records(path)]
 
 
 def solve_part_one(data: InputData) -> int:
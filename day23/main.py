@@ -1,19 +1,25 @@
 """Day 23"""
+import sys
+from pathlib import Path
 
-InputData = list[list[str]]
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.grid import Grid
+
+InputData = Grid
 Position = tuple[int, int]
 UP, DOWN = (-1, 0), (1, 0)
 LEFT, RIGHT = (0, -1), (0, 1)
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        return [list(row.strip()) for row in fin.readlines()]
+    return Grid.map_file(path)
 
 
 def solve_part_one(grid: InputData) -> int:
-    start_point = (0, grid[0].index("."))
-    end_point = (len(grid) - 1, grid[-1].index("."))
+    start_point = (0, grid.row(0).tobytes().index(b"."))
+    end_point = (grid.height - 1, grid.row(grid.height - 1).tobytes().index(b"."))
 
     edges = build_graph(grid)
 
@@ -27,10 +33,10 @@ def solve_part_one(grid: InputData) -> int:
 
 
 def solve_part_two(data: InputData) -> int:
-    dry_grid = [
-        ["." if c in "^v<>" else c for c in row]
-        for row in data
-    ]
+    slopes_to_paths = bytes.maketrans(b"^v<>", b"....")
+    dry_grid = Grid.from_rows(
+        row.tobytes().translate(slopes_to_paths) for row in data.rows()
+    )
     answer = solve_part_one(dry_grid)
 
     return answer
@@ -38,8 +44,9 @@ def solve_part_two(data: InputData) -> int:
 
 def build_graph(grid: InputData) -> dict[Position, list[tuple[Position, int]]]:
     nodes = [
-        (0, grid[0].index(".")),  # Start point
-        (len(grid) - 1, grid[-1].index(".")),  # End point
+        # Start and end points
+        (0, grid.row(0).tobytes().index(b".")),
+        (grid.height - 1, grid.row(grid.height - 1).tobytes().index(b".")),
         *get_junction_points(grid),
     ]
     edges = {node: [] for node in nodes} 
@@ -71,14 +78,14 @@ def build_graph(grid: InputData) -> dict[Position, list[tuple[Position, int]]]:
 
 
 def get_junction_points(grid: InputData) -> list[Position]:
-    height = len(grid)
-    width = len(grid[0])
+    height = grid.height
+    width = grid.width
 
     junction_points = []
 
     for i in range(height):
         for j in range(width):
-            if grid[i][j] == ".":
+            if grid[i, j] == ord("."):
                 neighbors = []
 
                 for di, dj in (UP, DOWN, LEFT, RIGHT):
@@ -92,7 +99,7 @@ def get_junction_points(grid: InputData) -> list[Position]:
                         continue
 
                     # Is there forest?
-                    if grid[new_i][new_j] == "#":
+                    if grid[new_i, new_j] == ord("#"):
                         continue
 
                     neighbors.append((new_i, new_j))
@@ -108,8 +115,8 @@ def get_neighbors(
     grid: InputData,
     visited: set[Position],
 ) -> list[Position]:
-    height = len(grid)
-    width = len(grid[0])
+    height = grid.height
+    width = grid.width
 
     neighbors = []
 
@@ -120,21 +127,23 @@ def get_neighbors(
         if new_i < 0 or new_i >= height or new_j < 0 or new_j >= width:
             continue
 
+        tile = chr(grid[new_i, new_j])
+
         # Is there forest?
-        if grid[new_i][new_j] == "#":
+        if tile == "#":
             continue
 
         # Are we moving downhill?
-        if grid[new_i][new_j] == "^" and (di, dj) != UP:
+        if tile == "^" and (di, dj) != UP:
             continue
 
-        if grid[new_i][new_j] == "v" and (di, dj) != DOWN:
+        if tile == "v" and (di, dj) != DOWN:
             continue
 
-        if grid[new_i][new_j] == "<" and (di, dj) != LEFT:
+        if tile == "<" and (di, dj) != LEFT:
             continue
 
-        if grid[new_i][new_j] == ">" and (di, dj) != RIGHT:
+        if tile == ">" and (di, dj) != RIGHT:
             continue
 
         if (new_i, new_j) in visited:
@@ -1,7 +1,14 @@
 """Day 24"""
+import sys
 from itertools import combinations
+from pathlib import Path
 from typing import NamedTuple
 
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.inputs import read_records
+
 
 class Hailstone(NamedTuple):
     x: int
@@ -23,8 +30,7 @@ InputData = list[Hailstone]
 
 
 def parse_input(path: str) -> InputData:
-    with open(path, "r") as fin:
-        return [Hailstone.from_raw(line) for line in fin.readlines()]
+    return [Hailstone.from_raw(line) for line in read_records(path)]
 
 
 def solve_part_one(data: InputData, val_min: int, val_max: int) -> int:
@@ -1,16 +1,23 @@
 """Day 25"""
+import sys
+from pathlib import Path
+
 import networkx as nx
 
+if __package__ in (None, ""):  # Run as a script from the day's directory
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc2023.inputs import read_records
+
 
 def parse_input(path: str) -> nx.Graph:
-    with open(path, "r") as fin:
-        g = nx.Graph()
-        for line in fin.readlines():
-            src, dsts = line.strip().split(": ")
-            for dst in dsts.split(" "):
-                g.add_edge(src, dst, capacity=1)
-
-        return g
+    g = nx.Graph()
+    for line in read_records(path):
+        src, dsts = line.split(": ")
+        for dst in dsts.split(" "):
+            g.add_edge(src, dst, capacity=1)
+
+    return g
 
 
 def solve_part_one(graph: nx.Graph) -> int: